@@ -10,12 +10,17 @@ Responsibilities:
   - Pass results to the correct tab
 """
 
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import ee
-from datetime import datetime
 
 from config.settings import PAGE_CONFIG
 from utils.hash_utils import HashUtils
+from utils.single_flight import SingleFlight
+from utils.streamlit_utils import bump_history_version, polling_fragment, rerun_if_poll_due
 from config.theme import THEME_CSS
 
 # Backend
@@ -28,14 +33,9 @@ from backend.db.analysis_repository import AnalysisRepository
 from backend.db.history_repository import HistoryRepository
 
 
-# Frontend
+# Frontend — tab modules (geemap, plotly, folium) are imported lazily by
+# their renderers below, so the first paint only loads the sidebar.
 from frontend.sidebar.sidebar import Sidebar
-from frontend.tabs.maps_tab import MapsTab
-from frontend.tabs.temporal_tab import TemporalTab
-from frontend.tabs.change_tab import ChangeTab
-from frontend.tabs.report_tab import ReportTab
-from frontend.tabs.history_tab import HistoryTab
-from frontend.tabs.land_cover_tab import render_land_cover_tab
 
 # ── Page config ──────────────────────────────────────────────────────────────
 st.set_page_config(**PAGE_CONFIG)
@@ -45,20 +45,22 @@ TAB_NAMES = ['Interactive Maps', 'Temporal Analysis', 'Change Detection', 'Land
 
 
 # ── Session state defaults ───────────────────────────────────────────────────
+_SESSION_DEFAULTS = {
+    'site_name':        'Alba Iulia Fortress',
+    'center_lat':       46.0686,
+    'center_lon':       23.5714,
+    'buffer_km':        2.0,
+    'analysis_results': None,
+    'active_tab':       0,
+    'custom_indices':   {},
+    'latest_drawings':  [],
+}
+
+
 def _init_session_state() -> None:
-    defaults = {
-        'site_name':        'Alba Iulia Fortress',
-        'center_lat':       46.0686,
-        'center_lon':       23.5714,
-        'buffer_km':        2.0,
-        'analysis_results': None,
-        'active_tab':       0,
-        'custom_indices':   [],
-        'latest_drawings':  [],
-    }
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    # Mutable defaults are copied so sessions never share one list object
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, copy.copy(value))
 
 
 # ── Cached singletons ────────────────────────────────────────────────────────
@@ -82,6 +84,59 @@ def _get_stats_calculator() -> StatisticsCalculator:
     return StatisticsCalculator()
 
 
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker pool for GEE jobs that must not block the script run."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix='gee-analysis')
+
+
+@st.cache_resource
+def _get_single_flight() -> SingleFlight:
+    """Shared across sessions, so identical analyses run as one GEE job."""
+    return SingleFlight(_get_executor())
+
+
+@st.cache_resource
+def _get_analysis_repo() -> AnalysisRepository:
+    return AnalysisRepository(_get_db())
+
+
+@st.cache_resource
+def _get_history_repo() -> HistoryRepository:
+    return HistoryRepository(_get_db())
+
+
+# ── Cached lookups ───────────────────────────────────────────────────────────
+@st.cache_resource(show_spinner=False)
+def _get_aoi(lat: float, lon: float, buffer_km: float) -> ee.Geometry:
+    """Buffered-point AOI, reused as long as centre and radius are unchanged."""
+    return _get_collection_builder().build_aoi(lat, lon, buffer_km)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _count_images(
+    lat: float, lon: float, buffer_km: float, start: str, end: str, cloud_cover: int
+) -> int:
+    """
+    Number of Sentinel-2 scenes for a query, keyed on primitives only.
+    Building the collection is a local graph operation; the size() call
+    is the round-trip worth caching.
+    """
+    col_builder = _get_collection_builder()
+    aoi         = _get_aoi(lat, lon, buffer_km)
+    return col_builder.count(col_builder.build(aoi, start, end, cloud_cover))
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _find_cached_stats(params_hash: str) -> dict | None:
+    """
+    Memoised sites_history lookup keyed on the params hash, so repeated
+    runs of the same configuration skip the SQL round-trip.
+    Cleared whenever a new analysis is saved.
+    """
+    return _get_analysis_repo().find_by_hash(params_hash)
+
+
 # ── Main ─────────────────────────────────────────────────────────────────────
 def main() -> None:
     _init_session_state()
@@ -105,8 +160,8 @@ def main() -> None:
     col_builder     = _get_collection_builder()
     idx_calc        = _get_index_calculator()
     stats_calc      = _get_stats_calculator()
-    analysis_repo   = AnalysisRepository(db)
-    history_repo    = HistoryRepository(db)
+    analysis_repo   = _get_analysis_repo()
+    history_repo    = _get_history_repo()
 
     # Sidebar → config dict
     config = Sidebar().render()
@@ -116,20 +171,22 @@ def main() -> None:
         _render_custom_region_map(config)
         return
 
-    # Build AOI
-    aoi = col_builder.build_aoi(
-        config['center_lat'], config['center_lon'], config['buffer_km']
-    )
-
-    # Run analysis when requested
+    # Run analysis when requested — the AOI is only needed to build a new
+    # collection; stored results carry their own.
     if config['run_analysis']:
+        aoi = _get_aoi(config['center_lat'], config['center_lon'], config['buffer_km'])
         _run_analysis(config, aoi, db, col_builder, idx_calc, stats_calc, analysis_repo, history_repo)
 
+    # Collect a background analysis if one is in flight
+    _poll_analysis_job(analysis_repo, history_repo)
+
     # Propagate fresh custom indices into stored results
     if st.session_state.analysis_results:
-        fresh_custom = st.session_state.get('custom_indices', [])
+        fresh_custom = st.session_state.get('custom_indices', {})
         if fresh_custom:
-            st.session_state.analysis_results['config']['custom_indices'] = fresh_custom
+            results = st.session_state.analysis_results
+            results['config']['custom_indices'] = list(fresh_custom.values())
+            results['custom_index_map']         = dict(fresh_custom)
 
     # Render tabs
     if st.session_state.analysis_results:
@@ -142,7 +199,7 @@ def main() -> None:
             key='tab_selector_empty',
         )
         if selected_tab == 'History':
-            HistoryTab(db, _get_collection_builder(), _get_index_calculator()).render()
+            _TAB_RENDERERS['History'](None, db, history_repo)
         else:
             st.info("Configure parameters in the sidebar and click 'Run Analysis' to begin.")
 
@@ -154,40 +211,104 @@ def main() -> None:
         unsafe_allow_html=True,
     )
 
+    # Only reached on Streamlit without fragments, where the progress notice
+    # cannot poll on its own
+    rerun_if_poll_due()
+
 
 # ── Analysis pipeline ────────────────────────────────────────────────────────
 def _run_analysis(
     config, aoi, db, col_builder, idx_calc, stats_calc, analysis_repo, history_repo
 ) -> None:
+    # A new request supersedes any job still in flight
+    st.session_state.pop('analysis_job', None)
+
+    start = config['start_date'].strftime('%Y-%m-%d')
+    end   = config['end_date'].strftime('%Y-%m-%d')
+
     with st.spinner('Connecting to satellite archive…'):
-        collection = col_builder.build(
-            aoi,
-            config['start_date'].strftime('%Y-%m-%d'),
-            config['end_date'].strftime('%Y-%m-%d'),
-            config['cloud_cover'],
+        collection = col_builder.build(aoi, start, end, config['cloud_cover'])
+        count = _count_images(
+            config['center_lat'], config['center_lon'], config['buffer_km'],
+            start, end, config['cloud_cover'],
         )
-        count = col_builder.count(collection)
 
     if count == 0:
         st.warning('No satellite images found for the selected period.')
         return
 
     # Try cache first
-    cached = analysis_repo.find_by_config(config)
+    params_hash = HashUtils.hash_config(config)
+    cached      = _find_cached_stats(params_hash)
     if cached:
         st.session_state.analysis_results = _build_results(
             config, collection, count, aoi, cached, is_from_cache=True
         )
         return
 
-    # Full computation
-    with st.spinner('Calculating spectral indices…'):
-        median      = collection.median()
-        indexed     = idx_calc.compute(median, extra_indices=config.get('custom_indices', []))
-        stats       = stats_calc.run_multiple(indexed, aoi, config['indices'])
+    # Full computation — one fused reduceRegion submitted to the worker
+    # pool and collected by _poll_analysis_job on subsequent reruns.
+    median      = collection.median()
+    indexed     = idx_calc.compute(median, extra_indices=config.get('custom_indices', []))
+    # Same analysis already running for another session/rerun → share it
+    flight_key  = json.dumps(
+        [params_hash, config['indices'], config.get('custom_indices', [])],
+        sort_keys=True, default=str,
+    )
 
     config['image_count'] = count
+    st.session_state.analysis_job = {
+        'config':     config,
+        'collection': collection,
+        'count':      count,
+        'aoi':        aoi,
+        'future':     _get_single_flight().submit(
+            flight_key, stats_calc.run_multiple, indexed, aoi, config['indices'],
+            StatisticsCalculator.scale_for(config['buffer_km']),
+        ),
+    }
+
+
+def _poll_analysis_job(analysis_repo, history_repo) -> None:
+    """
+    Check the background analysis job, if any.
+    Shows a self-polling progress notice while it runs; once the statistics
+    have resolved, persists them and publishes the results. A failed job
+    is reported and dropped; the previous results stay on screen.
+    """
+    job = st.session_state.get('analysis_job')
+    if job is None:
+        return
+
+    if not job['future'].done():
+        _analysis_progress(job)
+        return
+
+    try:
+        stats = job['future'].result()
+    except Exception as exc:
+        st.error(f'Analysis failed: {exc}. Adjust the parameters or run it again.')
+    else:
+        _finish_analysis(job, stats, analysis_repo, history_repo)
+    del st.session_state['analysis_job']
+
+
+@polling_fragment(run_every=1.0)
+def _analysis_progress(job: dict) -> None:
+    """Progress notice; only this fragment reruns until the job is done."""
+    if job['future'].done():
+        st.rerun()   # full run collects the result and renders the tabs
+    st.info(
+        f"Calculating {len(job['config']['indices'])} spectral indices "
+        f"over {job['count']} images…"
+    )
+
+
+def _finish_analysis(job: dict, stats: dict, analysis_repo, history_repo) -> None:
+    config, count = job['config'], job['count']
     analysis_repo.save(config, stats)
+    _find_cached_stats.clear()
+    bump_history_version()
 
     # Store indices list and image count in history meta
     try:
@@ -198,7 +319,7 @@ def _run_analysis(
         pass
 
     st.session_state.analysis_results = _build_results(
-        config, collection, count, aoi, stats, is_from_cache=False
+        config, job['collection'], count, job['aoi'], stats, is_from_cache=False
     )
 
 
@@ -210,10 +331,55 @@ def _build_results(config, collection, count, aoi, stats, is_from_cache) -> dict
         'aoi':           aoi,
         'stats':         stats,
         'is_from_cache': is_from_cache,
+        # Built once per analysis so tabs don't re-key custom indices on every rerun
+        'custom_index_map': {c['name']: c for c in config.get('custom_indices', [])},
+        # Outline-only AOI layer shared by the change and land-cover maps
+        'aoi_style': ee.FeatureCollection(aoi).style(
+            color='764ba2', fillColor='764ba200', width=2
+        ),
     }
 
 
 # ── Tab rendering ─────────────────────────────────────────────────────────────
+# Only the selected tab body runs on a rerun. st.tabs would execute all six
+# bodies every time — temporal back-fill, LLM interpretation, map tiles —
+# so navigation stays on the radio and dispatches through this table.
+def _render_maps(results, db, history_repo) -> None:
+    from frontend.tabs.maps_tab import MapsTab
+    MapsTab(results).render()
+
+
+def _render_temporal(results, db, history_repo) -> None:
+    from frontend.tabs.temporal_tab import TemporalTab
+    TemporalTab(results, db).render()
+
+
+def _render_change(results, db, history_repo) -> None:
+    from frontend.tabs.change_tab import ChangeTab
+    ChangeTab(results, history_repo=history_repo).render()
+
+
+def _render_land_cover(results, db, history_repo) -> None:
+    from frontend.tabs.land_cover_tab import render_land_cover_tab
+    render_land_cover_tab(results)
+
+
+def _render_report(results, db, history_repo) -> None:
+    from frontend.tabs.report_tab import ReportTab
+    ReportTab(results).render()
+
+
+def _render_history(results, db, history_repo) -> None:
+    from frontend.tabs.history_tab import HistoryTab
+    HistoryTab(db, _get_collection_builder(), _get_index_calculator()).render()
+
+
+_TAB_RENDERERS = dict(zip(TAB_NAMES, (
+    _render_maps, _render_temporal, _render_change,
+    _render_land_cover, _render_report, _render_history,
+)))
+
+
 def _render_tabs(results: dict, db: DBConnection, history_repo) -> None:
     selected_tab = st.radio(
         label='tabs',
@@ -224,19 +390,7 @@ def _render_tabs(results: dict, db: DBConnection, history_repo) -> None:
         key='tab_selector',
     )
     st.session_state.active_tab = TAB_NAMES.index(selected_tab)
-
-    if selected_tab == TAB_NAMES[0]:
-        MapsTab(results).render()
-    elif selected_tab == TAB_NAMES[1]:
-        TemporalTab(results, db).render()
-    elif selected_tab == TAB_NAMES[2]:
-        ChangeTab(results, history_repo=history_repo).render()
-    elif selected_tab == TAB_NAMES[3]:
-        render_land_cover_tab(results)
-    elif selected_tab == TAB_NAMES[4]:
-        ReportTab(results).render()
-    elif selected_tab == TAB_NAMES[5]:
-        HistoryTab(db, _get_collection_builder(), _get_index_calculator()).render()
+    _TAB_RENDERERS[selected_tab](results, db, history_repo)
 
 
 # ── Custom region helper ──────────────────────────────────────────────────────
@@ -273,9 +427,9 @@ def _update_coordinates_from_drawing() -> None:
                                     site_name='Custom Region (Point)')
             st.success(f'Updated: {lat:.4f}°N, {lon:.4f}°E')
         elif geometry['type'] == 'Polygon':
-            coords = geometry['coordinates'][0]
-            lat = sum(c[1] for c in coords) / len(coords)
-            lon = sum(c[0] for c in coords) / len(coords)
+            import numpy as np
+            lon, lat = (float(v) for v in
+                        np.asarray(geometry['coordinates'][0], dtype=np.float64).mean(axis=0))
             st.session_state.update(center_lat=lat, center_lon=lon,
                                     site_name='Custom Region (Polygon)')
             st.success(f'Polygon centre: {lat:.4f}°N, {lon:.4f}°E')
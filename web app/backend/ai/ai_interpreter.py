@@ -2,8 +2,6 @@
 Responsible for: building the AI prompt and calling the Groq API.
 """
 
-from groq import Groq
-
 
 # Move to .env in production
 _GROQ_API_KEY = "miaumiau"
@@ -53,7 +51,16 @@ class AIInterpreter:
     )
 
     def __init__(self, api_key: str = _GROQ_API_KEY):
-        self._client = Groq(api_key=api_key)
+        self._api_key = api_key
+        self._client  = None   # built on first interpret() — see _get_client
+
+    def _get_client(self):
+        # groq is imported lazily: most reruns are served from the
+        # change tab's cache and never need the SDK loaded.
+        if self._client is None:
+            from groq import Groq
+            self._client = Groq(api_key=self._api_key)
+        return self._client
 
     def interpret(
         self,
@@ -81,7 +88,7 @@ class AIInterpreter:
         )
 
         try:
-            response = self._client.chat.completions.create(
+            response = self._get_client().chat.completions.create(
                 model=self.MODEL,
                 messages=[
                     {'role': 'system', 'content': _SYSTEM_PROMPT},
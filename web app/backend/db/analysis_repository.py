@@ -2,9 +2,9 @@
 Responsible for: all SQL operations on the sites_history table.
 """
 
-import json
 from backend.db.db_connection import DBConnection
 from utils.hash_utils import HashUtils
+from utils.json_utils import JsonUtils
 
 
 class AnalysisRepository:
@@ -23,14 +23,14 @@ class AnalysisRepository:
             end_date     DATE,
             cloud_cover  INT,
             stats_json   LONGTEXT,
-            params_hash  VARCHAR(64) UNIQUE,
+            params_hash  VARCHAR(64) UNIQUE,   -- HashUtils: lat/lon rounded to 4 dp
             analysis_date DATETIME DEFAULT CURRENT_TIMESTAMP
         )
 
     Usage:
         repo = AnalysisRepository(db)
         repo.save(config, stats_dict)
-        result = repo.find_by_config(config)   # returns dict or None
+        result = repo.find_by_hash(HashUtils.hash_config(config))   # returns dict or None
     """
 
     def __init__(self, db: DBConnection):
@@ -58,7 +58,7 @@ class AnalysisRepository:
             config['start_date'],
             config['end_date'],
             config['cloud_cover'],
-            json.dumps(stats),
+            JsonUtils.dumps(stats),
             params_hash,
         )
 
@@ -72,9 +72,15 @@ class AnalysisRepository:
         """
         Return the cached stats dict for *config*, or None if not cached.
         """
-        params_hash = HashUtils.hash_config(config)
+        return self.find_by_hash(HashUtils.hash_config(config))
 
-        sql = "SELECT stats_json FROM sites_history WHERE params_hash = %s"
+    def find_by_hash(self, params_hash: str) -> dict | None:
+        """
+        Return the cached stats dict stored under *params_hash*, or None.
+        Lets callers memoise the lookup on the hash string alone.
+        """
+        # params_hash is UNIQUE, so this is a single index probe
+        sql = "SELECT stats_json FROM sites_history WHERE params_hash = %s LIMIT 1"
 
         with self._db.get() as conn:
             cursor = conn.cursor(dictionary=True)
@@ -82,7 +88,7 @@ class AnalysisRepository:
             row = cursor.fetchone()
             cursor.close()
 
-        return json.loads(row['stats_json']) if row else None
+        return JsonUtils.loads(row['stats_json']) if row else None
 
     def find_all(self) -> list[dict]:
         """Return all rows from sites_history ordered by most recent first."""
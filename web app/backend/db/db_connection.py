@@ -2,25 +2,32 @@
 Responsible for: managing MySQL connections.
 """
 
+import os
+import threading
+
 import mysql.connector
+from mysql.connector import pooling
 from mysql.connector.connection import MySQLConnection
+from mysql.connector.errors import PoolError
 from contextlib import contextmanager
 
 
-# Connection parameters — move to .env / config in production
+# Connection parameters — overridable through the environment
 _DB_CONFIG = {
-    'host':     'localhost',
-    'user':     'root',
-    'password': 'root',
-    'database': 'heritage_monitor',
+    'host':     os.environ.get('HERITAGE_DB_HOST',     'localhost'),
+    'user':     os.environ.get('HERITAGE_DB_USER',     'root'),
+    'password': os.environ.get('HERITAGE_DB_PASSWORD', 'root'),
+    'database': os.environ.get('HERITAGE_DB_NAME',     'heritage_monitor'),
 }
 
 
 class DBConnection:
     """
-    Provides MySQL connections.
+    Provides MySQL connections from a process-wide pool, so a rerun reuses
+    open sockets instead of doing a TCP + auth handshake per query.
+    app.py keeps one instance in st.cache_resource.
 
-    Use as a context manager to ensure the connection is always closed:
+    Use as a context manager to ensure the connection is always released:
 
         conn_mgr = DBConnection()
         with conn_mgr.get() as conn:
@@ -28,19 +35,25 @@ class DBConnection:
             cursor.execute(...)
     """
 
+    POOL_NAME = 'heritage_monitor'
+    POOL_SIZE = 8
+
     def __init__(self, config: dict | None = None):
-        self._config = config or _DB_CONFIG
+        self._config    = config or _DB_CONFIG
+        self._pool      = None
+        self._pool_lock = threading.Lock()
 
     @contextmanager
     def get(self):
         """
-        Yield an open MySQLConnection and close it automatically.
+        Yield an open MySQLConnection and release it automatically
+        (closing a pooled connection hands it back to the pool).
 
         Usage:
             with db.get() as conn:
                 ...
         """
-        conn: MySQLConnection = mysql.connector.connect(**self._config)
+        conn = self._checkout()
         try:
             yield conn
         finally:
@@ -51,4 +64,24 @@ class DBConnection:
         Return a raw connection for callers that manage lifecycle themselves.
         Caller is responsible for calling .close().
         """
-        return mysql.connector.connect(**self._config)
\ No newline at end of file
+        return mysql.connector.connect(**self._config)
+
+    # ── Private ──────────────────────────────────────────────────────────────
+
+    def _checkout(self):
+        """Pooled connection, or a direct one if the pool is exhausted."""
+        try:
+            return self._get_pool().get_connection()
+        except PoolError:
+            return mysql.connector.connect(**self._config)
+
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        # Created on first use so building DBConnection never touches MySQL
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = pooling.MySQLConnectionPool(
+                    pool_name=self.POOL_NAME,
+                    pool_size=self.POOL_SIZE,
+                    **self._config,
+                )
+            return self._pool
@@ -3,9 +3,9 @@ Responsible for: all SQL operations related to the history feature.
 Tables: sites_history, change_snapshots, analysis_notes.
 """
 
-import json
 from datetime import date
 from backend.db.db_connection import DBConnection
+from utils.json_utils import JsonUtils
 
 
 class HistoryRepository:
@@ -56,7 +56,7 @@ class HistoryRepository:
         """
         with self._db.get() as conn:
             cur = conn.cursor()
-            cur.execute(sql, (json.dumps(indices), image_count, history_id))
+            cur.execute(sql, (JsonUtils.dumps(indices), image_count, history_id))
             conn.commit()
             cur.close()
 
@@ -97,8 +97,8 @@ class HistoryRepository:
 
         # Decode JSON columns
         for row in rows:
-            row['indices']     = json.loads(row['indices_json'])  if row['indices_json'] else []
-            row['stats']       = json.loads(row['stats_json'])    if row['stats_json']   else {}
+            row['indices']     = JsonUtils.loads(row['indices_json'])  if row['indices_json'] else []
+            row['stats']       = JsonUtils.loads(row['stats_json'])    if row['stats_json']   else {}
         return rows
 
     def get_session(self, history_id: int) -> dict | None:
@@ -119,8 +119,8 @@ class HistoryRepository:
         if not meta:
             return None
 
-        meta['indices']  = json.loads(meta['indices_json'])  if meta['indices_json'] else []
-        meta['stats']    = json.loads(meta['stats_json'])    if meta['stats_json']   else {}
+        meta['indices']  = JsonUtils.loads(meta['indices_json'])  if meta['indices_json'] else []
+        meta['stats']    = JsonUtils.loads(meta['stats_json'])    if meta['stats_json']   else {}
 
         meta['snapshots'] = self.get_snapshots(history_id)
         meta['notes']     = self.get_notes(history_id)
@@ -151,7 +151,7 @@ class HistoryRepository:
             snap.get('before_median'),
             snap.get('after_median'),
             snap.get('delta_median'),
-            json.dumps(snap.get('events', [])),
+            JsonUtils.dumps(snap.get('events', [])),
             snap.get('ai_text', ''),
         )
         with self._db.get() as conn:
@@ -178,7 +178,7 @@ class HistoryRepository:
             cur.close()
 
         for row in rows:
-            row['events'] = json.loads(row['events_json']) if row['events_json'] else []
+            row['events'] = JsonUtils.loads(row['events_json']) if row['events_json'] else []
         return rows
 
     # ── analysis_notes ────────────────────────────────────────────────────────
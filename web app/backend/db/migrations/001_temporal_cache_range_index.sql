@@ -0,0 +1,22 @@
+-- temporal_cache: serve TemporalRepository.find_range / get_existing_dates
+-- from an index instead of a table scan.
+--
+--   WHERE site_name = ? AND index_name = ? AND analysis_date BETWEEN ? AND ?
+--   ORDER BY analysis_date
+--
+-- The schema already declares UNIQUE KEY uq_site_index_date (site_name,
+-- index_name, analysis_date), which makes INSERT IGNORE drop same-day
+-- duplicates; this migration leaves it alone. MySQL has no INCLUDE clause,
+-- so the new index repeats that 3-column prefix and appends `value` to make
+-- it covering: range scans never touch the clustered rows. The two indexes
+-- share the prefix on purpose; the unique key stays for the constraint.
+--
+-- Verify afterwards with:
+--   EXPLAIN SELECT analysis_date, value FROM temporal_cache
+--   WHERE site_name = 'x' AND index_name = 'NDVI'
+--     AND analysis_date BETWEEN '2024-01-01' AND '2024-12-31'
+--   ORDER BY analysis_date;
+-- which should report key = ix_site_idx_date_value and "Using index".
+
+ALTER TABLE temporal_cache
+    ADD INDEX ix_site_idx_date_value (site_name, index_name, analysis_date, value);
@@ -18,12 +18,15 @@ class TemporalRepository:
             index_name    VARCHAR(50),
             analysis_date DATE,
             value         DOUBLE,
-            UNIQUE KEY uq_site_index_date (site_name, index_name, analysis_date)
+            UNIQUE KEY uq_site_index_date (site_name, index_name, analysis_date),
+            INDEX ix_site_idx_date_value (site_name, index_name, analysis_date, value)
         )
+        (see migrations/001_temporal_cache_range_index.sql)
 
     Usage:
         repo = TemporalRepository(db)
         repo.save_point('Alba Iulia', 'NDVI', date(2024, 6, 1), 0.45)
+        repo.save_points('Alba Iulia', [('NDVI', date(2024, 6, 1), 0.45)])
         df = repo.find_range('Alba Iulia', 'NDVI', start, end)
     """
 
@@ -52,6 +55,29 @@ class TemporalRepository:
             conn.commit()
             cursor.close()
 
+    def save_points(
+        self,
+        site_name: str,
+        rows: list[tuple],   # (index_name, datetime.date, value)
+    ) -> None:
+        """
+        Insert many data points with one executemany in a single
+        transaction. Silently ignores duplicates (INSERT IGNORE).
+        """
+        if not rows:
+            return
+        sql = """
+            INSERT IGNORE INTO temporal_cache
+                (site_name, index_name, analysis_date, value)
+            VALUES (%s, %s, %s, %s)
+        """
+        params = [(site_name, idx, day, float(val)) for idx, day, val in rows]
+        with self._db.get() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(sql, params)
+            conn.commit()
+            cursor.close()
+
     def find_range(
         self,
         site_name: str,
@@ -64,7 +90,7 @@ class TemporalRepository:
         within [start_date, end_date] ordered ascending.
 
         Returns:
-            DataFrame with columns ['analysis_date', 'value'].
+            DataFrame with columns ['analysis_date' (datetime64), 'value' (float64)].
             Empty DataFrame if no data found.
         """
         sql = """
@@ -76,8 +102,18 @@ class TemporalRepository:
             ORDER BY analysis_date ASC
         """
         with self._db.get() as conn:
-            df = pd.read_sql(sql, conn, params=(site_name, index_name, start_date, end_date))
-        return df
+            cursor = conn.cursor()
+            cursor.execute(sql, (site_name, index_name, start_date, end_date))
+            rows = cursor.fetchall()
+            cursor.close()
+
+        # Typed columns straight from the cursor tuples: no DBAPI read_sql
+        # fallback, and dates arrive as datetime64 rather than objects
+        dates, values = zip(*rows) if rows else ((), ())
+        return pd.DataFrame({
+            'analysis_date': pd.to_datetime(list(dates)),
+            'value':         pd.Series(values, dtype='float64'),
+        })
 
     def get_existing_dates(
         self,
@@ -90,7 +126,16 @@ class TemporalRepository:
         Return a set of ISO date strings already stored for the given
         site/index/range. Used to skip re-fetching from GEE.
         """
-        df = self.find_range(site_name, index_name, start_date, end_date)
-        if df.empty:
-            return set()
-        return set(df['analysis_date'].astype(str))
\ No newline at end of file
+        sql = """
+            SELECT analysis_date
+            FROM temporal_cache
+            WHERE site_name = %s
+              AND index_name = %s
+              AND analysis_date BETWEEN %s AND %s
+        """
+        with self._db.get() as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, (site_name, index_name, start_date, end_date))
+            dates = {row[0].isoformat() for row in cursor.fetchall()}
+            cursor.close()
+        return dates
\ No newline at end of file
@@ -3,10 +3,14 @@ Responsible for: assembling export data (JSON dict, plain text, CSV bytes).
 The result is always a plain Python object ready for st.download_button.
 """
 
-import json
-import pandas as pd
+import csv
+import math
 from datetime import datetime
-from io import BytesIO
+from functools import cached_property
+from itertools import chain
+from io import BytesIO, TextIOWrapper
+
+from utils.json_utils import JsonUtils
 
 
 class ReportBuilder:
@@ -20,6 +24,10 @@ class ReportBuilder:
         csv_bytes = builder.as_csv()
     """
 
+    # Stat key suffixes and their export labels, in output column order
+    _METRIC_SUFFIXES = ('_median', '_stdDev', '_min', '_max')
+    _METRIC_LABELS   = ('median', 'std_deviation', 'minimum', 'maximum')
+
     def __init__(self, config: dict, stats: dict, count: int):
         """
         Args:
@@ -36,17 +44,51 @@ class ReportBuilder:
 
     def as_json(self) -> str:
         """Return a JSON string of the full structured export."""
-        return json.dumps(self._build_dict(), indent=2)
+        return JsonUtils.dumps(self._build_dict(), pretty=True)
 
     def as_text(self) -> str:
         """Return a human-readable plain-text export."""
-        cfg = self._config
-        sep = '=' * 100
-        thin = '-' * 100
+        return '\n'.join(chain(
+            self._text_header(), self._text_spectral(), self._text_footer(),
+        ))
+
+    def as_csv(self) -> bytes:
+        """Return CSV bytes of per-index statistics (for st.download_button)."""
+        # Rows are encoded straight into the byte buffer, no str copy to re-encode
+        buf  = BytesIO()
+        text = TextIOWrapper(buf, encoding='utf-8', newline='', write_through=True)
+        writer = csv.writer(text, lineterminator='\n')
+        writer.writerow(['Index', 'Median', 'Std_Deviation', 'Minimum', 'Maximum'])
+        writer.writerows((idx, *row) for idx, row in self._spectral_rows.items())
+        text.detach()   # keep buf open when the wrapper is collected
+        return buf.getvalue()
+
+    @staticmethod
+    def area_km2(buffer_km: float) -> float:
+        """Area of the circular AOI in km², rounded to 2 dp (single source for all exports)."""
+        return round(math.pi * buffer_km ** 2, 2)
+
+    def filename_base(self) -> str:
+        """Return a safe filename prefix (no extension)."""
+        site = self._config['site_name'].replace(' ', '_')
+        ts   = self._now.strftime('%Y%m%d_%H%M%S')
+        return f"{site}_report_{ts}"
+
+    # ── Private ──────────────────────────────────────────────────────────────
+
+    # Plain-text sections: generators of lines, chained by as_text. A section
+    # with nothing to report yields nothing and builds none of its lines.
+    _TEXT_SEP  = '=' * 100
+    _TEXT_THIN = '-' * 100
+
+    def _text_header(self):
+        cfg  = self._config
+        sep  = self._TEXT_SEP
+        thin = self._TEXT_THIN
         duration = (cfg['end_date'] - cfg['start_date']).days
-        area = 3.14159 * (cfg['buffer_km'] ** 2)
+        area = self.area_km2(cfg['buffer_km'])
 
-        lines = [
+        yield from (
             sep,
             'HERITAGE SITE MONITORING REPORT',
             sep,
@@ -71,61 +113,49 @@ class ReportBuilder:
             f"Resolution:     10 metres",
             f"Cloud Cover:    ≤ {cfg['cloud_cover']}%",
             f"Indices:        {', '.join(cfg['indices'])}",
-        ]
-
-        if self._stats:
-            lines += ['', 'SPECTRAL INDICES RESULTS', thin]
-            for idx in cfg['indices']:
-                s = self._stats.get(idx, {})
-                lines += [
-                    f"\n{idx}:",
-                    f"  Median:      {s.get(f'{idx}_median', 0):.6f}",
-                    f"  Std Dev:     {s.get(f'{idx}_stdDev', 0):.6f}",
-                    f"  Min:         {s.get(f'{idx}_min', 0):.6f}",
-                    f"  Max:         {s.get(f'{idx}_max', 0):.6f}",
-                ]
-
-        lines += [
+        )
+
+    def _text_spectral(self):
+        if not self._stats:
+            return
+        yield from ('', 'SPECTRAL INDICES RESULTS', self._TEXT_THIN)
+        for idx, (median, std, lo, hi) in self._spectral_rows.items():
+            yield f"\n{idx}:"
+            yield f"  Median:      {median:.6f}"
+            yield f"  Std Dev:     {std:.6f}"
+            yield f"  Min:         {lo:.6f}"
+            yield f"  Max:         {hi:.6f}"
+
+    def _text_footer(self):
+        yield from (
             '',
             'REPORT GENERATION',
-            thin,
+            self._TEXT_THIN,
             f"Generated:      {self._now.strftime('%B %d, %Y at %H:%M:%S')}",
             f"System:         Heritage Site Monitoring System v1.0",
             '',
-            sep,
+            self._TEXT_SEP,
             'END OF REPORT',
-            sep,
-        ]
-        return '\n'.join(lines)
+            self._TEXT_SEP,
+        )
 
-    def as_csv(self) -> bytes:
-        """Return CSV bytes of per-index statistics (for st.download_button)."""
-        rows = []
+    @cached_property
+    def _spectral_rows(self) -> dict[str, tuple]:
+        """
+        {index: (median, std dev, min, max)} for every configured index,
+        0 where a metric is missing. Built once and shared by the JSON,
+        text and CSV exports.
+        """
+        rows = {}
         for idx in self._config['indices']:
             s = self._stats.get(idx, {})
-            rows.append({
-                'Index':         idx,
-                'Median':        s.get(f'{idx}_median',   0),
-                'Std_Deviation': s.get(f'{idx}_stdDev', 0),
-                'Minimum':       s.get(f'{idx}_min',    0),
-                'Maximum':       s.get(f'{idx}_max',    0),
-            })
-        buf = BytesIO()
-        pd.DataFrame(rows).to_csv(buf, index=False)
-        return buf.getvalue()
-
-    def filename_base(self) -> str:
-        """Return a safe filename prefix (no extension)."""
-        site = self._config['site_name'].replace(' ', '_')
-        ts   = self._now.strftime('%Y%m%d_%H%M%S')
-        return f"{site}_report_{ts}"
-
-    # ── Private ──────────────────────────────────────────────────────────────
+            rows[idx] = tuple(s.get(idx + suffix, 0) for suffix in self._METRIC_SUFFIXES)
+        return rows
 
     def _build_dict(self) -> dict:
         cfg = self._config
         duration = (cfg['end_date'] - cfg['start_date']).days
-        area     = round(3.14159 * (cfg['buffer_km'] ** 2), 2)
+        area     = self.area_km2(cfg['buffer_km'])
 
         data = {
             'metadata': {
@@ -160,13 +190,8 @@ class ReportBuilder:
 
         if self._stats:
             data['spectral_analysis'] = {
-                idx: {
-                    'median':        self._stats[idx].get(f'{idx}_median',   0),
-                    'std_deviation': self._stats[idx].get(f'{idx}_stdDev', 0),
-                    'minimum':       self._stats[idx].get(f'{idx}_min',    0),
-                    'maximum':       self._stats[idx].get(f'{idx}_max',    0),
-                }
-                for idx in self._config['indices']
+                idx: dict(zip(self._METRIC_LABELS, row))
+                for idx, row in self._spectral_rows.items()
                 if idx in self._stats
             }
 
@@ -2,7 +2,10 @@
 Responsible for: detecting and sampling spatial change between two EE Images.
 """
 
+import math
+
 import ee
+import numpy as np
 from datetime import datetime
 
 
@@ -38,6 +41,18 @@ def _classify_severity(delta: float) -> str:
     return 'low'
 
 
+def _classify_delta(delta: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Vectorised twin of build_change_overlay's server-side expression
+    'd < -t ? 1 : (d > t ? 2 : 0)': uint8 class per pixel, 0 = no change,
+    1 = decrease, 2 = increase. NaN (masked) pixels compare False → 0.
+    """
+    return (
+        (delta < -threshold).view(np.uint8)
+        + (delta > threshold).view(np.uint8) * np.uint8(2)
+    )
+
+
 class ChangeDetector:
     """
     Detects significant pixel-level changes between two EE Images for a
@@ -49,10 +64,27 @@ class ChangeDetector:
             first_image, last_image, aoi, 'NDVI', threshold=0.20
         )
         overlay_image = detector.build_change_overlay(first_image, last_image, 'NDVI', threshold=0.20)
+
+        # Small AOIs: fetch once, then blend locally for any threshold
+        rgb, delta, bounds = detector.fetch_change_arrays(first_image, last_image, 'NDVI', lat, lon, 2.0)
+        overlay_rgba = ChangeDetector.blend_change_arrays(rgb, delta, threshold=0.20)
+        summary      = ChangeDetector.local_change_stats(delta, threshold=0.20)
     """
 
     SAMPLE_SCALE    = 30    # metres — coarser grid for efficient sampling
     MAX_SAMPLE_PTS  = 15
+    VIS_RGB         = {'bands': ['B4', 'B3', 'B2'], 'min': 0, 'max': 3000, 'gamma': 1.4}
+    CHANGE_PALETTE  = ['000000', 'FF0000', '0000C8']   # none / decrease / increase
+    # Same palette as a class → RGB lookup table for the local NumPy blend
+    CHANGE_RGB      = np.array(
+        [[int(hex_[i:i + 2], 16) for i in (0, 2, 4)] for hex_ in CHANGE_PALETTE],
+        dtype=np.float32,
+    )
+
+    # Client-side overlay: AOIs up to this radius are fetched as one array
+    LOCAL_MAX_BUFFER_KM = 3.0
+    LOCAL_GRID_PX       = 512   # 512 px over ≤ 6 km ≈ native 10 m resolution
+    KM_PER_DEG_LAT      = 111.32
 
     def sample_change_points(
         self,
@@ -130,40 +162,125 @@ class ChangeDetector:
         Returns:
             ee.Image with bands vis-red, vis-green, vis-blue (uint8).
         """
-        vis_rgb = {'bands': ['B4', 'B3', 'B2'], 'min': 0, 'max': 3000, 'gamma': 1.4}
+        vis_rgb = self.VIS_RGB
 
-        diff          = last_image.select(index).subtract(first_image.select(index))
-        decrease_mask = diff.lt(-threshold)
-        increase_mask = diff.gt(threshold)
-        change_mask   = decrease_mask.Or(increase_mask)
+        diff = last_image.select(index).subtract(first_image.select(index))
 
-        r = ee.Image(255).multiply(decrease_mask).add(ee.Image(0).multiply(increase_mask))
-        g = ee.Image(0)
-        b = ee.Image(0).multiply(decrease_mask).add(ee.Image(200).multiply(increase_mask))
+        # One categorical band (0 none, 1 decrease, 2 increase) in a single pass
+        classes = diff.expression(
+            'd < -t ? 1 : (d > t ? 2 : 0)', {'d': diff, 't': threshold}
+        )
+        change_colored = classes.visualize(min=0, max=2, palette=self.CHANGE_PALETTE)
+        after_rgb      = last_image.visualize(**vis_rgb)
 
-        change_colored = (
-            ee.Image.cat([r, g, b])
+        # One fused blend over all three bands instead of a .where() per band
+        blended = after_rgb.expression(
+            'base * 0.3 + col * 0.7', {'base': after_rgb, 'col': change_colored}
+        )
+        return (
+            after_rgb.where(classes.gt(0), blended)
             .rename(['vis-red', 'vis-green', 'vis-blue'])
             .toUint8()
-            .updateMask(change_mask)
         )
-        after_rgb = last_image.visualize(**vis_rgb)
 
-        r_f = after_rgb.select('vis-red').where(
-            change_mask,
-            after_rgb.select('vis-red').multiply(0.3).add(change_colored.select('vis-red').multiply(0.7))
-        )
-        g_f = after_rgb.select('vis-green').where(
-            change_mask,
-            after_rgb.select('vis-green').multiply(0.3).add(change_colored.select('vis-green').multiply(0.7))
-        )
-        b_f = after_rgb.select('vis-blue').where(
-            change_mask,
-            after_rgb.select('vis-blue').multiply(0.3).add(change_colored.select('vis-blue').multiply(0.7))
+    # ── Client-side overlay (small AOIs) ─────────────────────────────────────
+
+    def fetch_change_arrays(
+        self,
+        first_image: ee.Image,
+        last_image: ee.Image,
+        index: str,
+        lat: float,
+        lon: float,
+        buffer_km: float,
+        grid_px: int = LOCAL_GRID_PX,
+    ) -> tuple[np.ndarray, np.ndarray, list[list[float]]]:
+        """
+        Fetch the after-image RGB and the index delta over the AOI bounding
+        box as NumPy arrays with a single computePixels call.
+
+        computePixels fills masked pixels with 0, so the delta's mask is
+        fetched as a band too and turned into NaN here: cloud-masked pixels
+        must not count as "no change".
+
+        Returns:
+            (rgb, delta, bounds): rgb is (H, W, 3) float32 in 0-255, delta is
+            (H, W) float32 with NaN where masked, bounds is
+            [[south, west], [north, east]] for a folium ImageOverlay.
+        """
+        d_lat = buffer_km / self.KM_PER_DEG_LAT
+        d_lon = buffer_km / (self.KM_PER_DEG_LAT * math.cos(math.radians(lat)))
+
+        diff  = last_image.select(index).subtract(first_image.select(index))
+        stack = (
+            last_image.visualize(**self.VIS_RGB).toFloat()
+            .addBands(diff.rename('delta').toFloat())
+            .addBands(diff.mask().rename('valid').toFloat())
         )
+        pixels = ee.data.computePixels({
+            'expression': stack,
+            'fileFormat': 'NUMPY_NDARRAY',
+            'grid': {
+                'dimensions': {'width': grid_px, 'height': grid_px},
+                'affineTransform': {
+                    'scaleX': 2 * d_lon / grid_px, 'shearX': 0, 'translateX': lon - d_lon,
+                    'shearY': 0, 'scaleY': -2 * d_lat / grid_px, 'translateY': lat + d_lat,
+                },
+                'crsCode': 'EPSG:4326',
+            },
+        })
 
-        return (
-            ee.Image.cat([r_f, g_f, b_f])
-            .rename(['vis-red', 'vis-green', 'vis-blue'])
-            .toUint8()
-        )
\ No newline at end of file
+        rgb    = np.dstack([pixels['vis-red'], pixels['vis-green'], pixels['vis-blue']])
+        delta  = np.where(pixels['valid'] > 0, pixels['delta'], np.nan).astype(np.float32)
+        bounds = [[lat - d_lat, lon - d_lon], [lat + d_lat, lon + d_lon]]
+        return rgb.astype(np.float32), delta, bounds
+
+    @staticmethod
+    def local_change_stats(delta: np.ndarray, threshold: float = 0.20) -> dict:
+        """
+        Summary of a fetched delta grid in one vectorised pass (NaN = masked):
+        mean / std / min / max of Δ over valid pixels and the share of valid
+        pixels classified as decrease or increase at *threshold*.
+
+        Returns:
+            Dict with keys mean, std, min, max, decrease_pct, increase_pct
+            (all None / 0.0 when no pixel is valid).
+        """
+        valid = delta[~np.isnan(delta)]
+        if valid.size == 0:
+            return {'mean': None, 'std': None, 'min': None, 'max': None,
+                    'decrease_pct': 0.0, 'increase_pct': 0.0}
+        counts = np.bincount(_classify_delta(valid, threshold), minlength=3)
+        return {
+            'mean': float(valid.mean()),
+            'std':  float(valid.std()),
+            'min':  float(valid.min()),
+            'max':  float(valid.max()),
+            'decrease_pct': 100.0 * counts[1] / valid.size,
+            'increase_pct': 100.0 * counts[2] / valid.size,
+        }
+
+    @staticmethod
+    def blend_change_arrays(
+        rgb: np.ndarray, delta: np.ndarray, threshold: float = 0.20
+    ) -> np.ndarray:
+        """
+        NumPy counterpart of build_change_overlay: tint decreases red and
+        increases blue (30 % base / 70 % colour) where |delta| > threshold.
+
+        Returns:
+            (H, W, 4) uint8 RGBA array, transparent where delta is NaN
+            (masked), like the EE tiles. folium's ImageOverlay writes RGBA
+            uint8 as is; RGB input would get a float alpha and every channel
+            stretched to its own maximum.
+        """
+        classes = _classify_delta(delta, threshold)
+        change  = classes > 0
+
+        out = rgb.copy()
+        out[change] = rgb[change] * 0.3 + ChangeDetector.CHANGE_RGB[classes[change]] * 0.7
+
+        rgba = np.empty(out.shape[:2] + (4,), dtype=np.uint8)
+        rgba[..., :3] = out
+        rgba[..., 3]  = np.where(np.isnan(delta), 0, 255)
+        return rgba
@@ -36,11 +36,14 @@ class CollectionBuilder:
         Returns:
             Filtered ee.ImageCollection.
         """
-        return (
-            ee.ImageCollection(self.COLLECTION_ID)
-            .filterBounds(geometry)
-            .filterDate(start_date, end_date)
-            .filter(ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', cloud_cover))
+        # One combined filter, cheapest metadata predicate first, so scenes
+        # are pruned before the geometry intersection is evaluated.
+        return ee.ImageCollection(self.COLLECTION_ID).filter(
+            ee.Filter.And(
+                ee.Filter.lt('CLOUDY_PIXEL_PERCENTAGE', cloud_cover),
+                ee.Filter.date(start_date, end_date),
+                ee.Filter.bounds(geometry),
+            )
         )
 
     def count(self, collection: ee.ImageCollection) -> int:
@@ -51,6 +54,17 @@ class CollectionBuilder:
         """Return list of Unix millisecond timestamps for all images."""
         return collection.aggregate_array('system:time_start').getInfo()
 
+    def get_date_range(self, collection: ee.ImageCollection) -> tuple[str, str]:
+        """
+        Return the earliest and latest acquisition dates as 'YYYY-MM-DD',
+        formatted server-side and fetched in a single getInfo.
+        """
+        dates = ee.Dictionary({
+            'first': ee.Date(collection.aggregate_min('system:time_start')).format('YYYY-MM-dd'),
+            'last':  ee.Date(collection.aggregate_max('system:time_start')).format('YYYY-MM-dd'),
+        }).getInfo()
+        return dates['first'], dates['last']
+
     def build_aoi(self, lat: float, lon: float, buffer_km: float) -> ee.Geometry:
         """
         Create a circular area of interest from a centre point.
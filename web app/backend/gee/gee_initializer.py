@@ -3,13 +3,17 @@ Responsible for: authenticating and initialising the Google Earth Engine session
 """
 
 import ee
-from config.settings import EE_PROJECT_ID
+from config.settings import EE_PROJECT_ID, EE_HIGH_VOLUME_URL
 
 
 class GEEInitializer:
     """
     Handles Earth Engine authentication and project initialisation.
     Call GEEInitializer.init() once at application startup.
+
+    The session is bound to the high-volume endpoint, which is built for
+    many small concurrent requests (getInfo, reduceRegion, map tiles)
+    rather than the per-user QPS caps of the interactive endpoint.
     """
 
     _initialized: bool = False
@@ -26,7 +30,7 @@ class GEEInitializer:
         if cls._initialized:
             return
         try:
-            ee.Initialize(project=EE_PROJECT_ID)
+            ee.Initialize(project=EE_PROJECT_ID, opt_url=EE_HIGH_VOLUME_URL)
             cls._initialized = True
         except Exception as exc:
             raise RuntimeError(
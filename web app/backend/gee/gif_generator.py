@@ -48,10 +48,9 @@ class GifGenerator:
         Returns:
             Tuple of (gif_url, n_frames_used, was_down_sampled).
         """
-        sampled_col, n_frames = self._sample_collection(
+        sampled_col, n_frames, total = self._sample_collection(
             collection, dimensions, date_range_days
         )
-        total = collection.size().getInfo()
         was_sampled = n_frames < total
 
         if selected_view == 'Natural Color (RGB)':
@@ -86,21 +85,24 @@ class GifGenerator:
         collection: ee.ImageCollection,
         dimensions: int,
         date_range_days: int,
-    ) -> tuple[ee.ImageCollection, int]:
+    ) -> tuple[ee.ImageCollection, int, int]:
         """
         Reduce the collection to stay within GEE_MAX_PIXELS.
-        Returns (filtered_collection, n_frames).
+        Returns (filtered_collection, n_frames, total_images).
+
+        The timestamps are fetched in one round-trip and double as the
+        image count, instead of separate size() and aggregate calls.
         """
         max_frames = max(1, GEE_MAX_PIXELS // (dimensions * dimensions))
-        total      = collection.size().getInfo()
+        timestamps = sorted(collection.aggregate_array('system:time_start').getInfo())
+        total      = len(timestamps)
 
         if total <= max_frames:
-            return collection, total
+            return collection, total, total
 
         interval_days = self._pick_interval(date_range_days)
         millis_interval = interval_days * 24 * 60 * 60 * 1000
 
-        timestamps = sorted(collection.aggregate_array('system:time_start').getInfo())
         selected, last_kept = [], None
 
         for ts in timestamps:
@@ -113,7 +115,7 @@ class GifGenerator:
         filtered = collection.filter(
             ee.Filter.inList('system:time_start', selected)
         )
-        return filtered, len(selected)
+        return filtered, len(selected), total
 
     @staticmethod
     def _pick_interval(date_range_days: int) -> int:
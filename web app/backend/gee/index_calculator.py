@@ -2,9 +2,61 @@
 Responsible for: computing spectral indices on EE Images.
 """
 
+import re
+from functools import lru_cache
+
 import ee
 from config.indices_config import INDICES_CONFIG
 
+# Bare identifiers in an EE expression: not an attribute, not a call like b('B8')
+_EXPR_IDENTIFIER = re.compile(r'(?<![\w.])([A-Za-z_]\w*)\b(?!\s*\()')
+_EXPR_STRING     = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+
+@lru_cache(maxsize=128)
+def _expression_variables(expression: str) -> frozenset[str]:
+    """Variable names referenced by *expression* — scanned once per distinct string."""
+    return frozenset(_EXPR_IDENTIFIER.findall(_EXPR_STRING.sub('', expression)))
+
+
+class _SharedBands:
+    """
+    Per-image memo of the band terms several formulas share: reflectance-
+    scaled bands, normalised differences and SAVI. Each is built on first
+    use, so EVI, SAVI, BSI, IBI and the normalized_diff indices reference
+    one graph node per term instead of re-selecting bands each time.
+    """
+
+    SAVI_L = 0.5
+
+    def __init__(self, image: ee.Image):
+        self._image = image
+        self._memo  = {}
+
+    def scaled(self, band: str) -> ee.Image:
+        """Band in reflectance units (DN / 10000)."""
+        key = ('scaled', band)
+        if key not in self._memo:
+            self._memo[key] = self._image.select(band).divide(10000)
+        return self._memo[key]
+
+    def normalized_diff(self, band_a: str, band_b: str) -> ee.Image:
+        key = ('nd', band_a, band_b)
+        if key not in self._memo:
+            self._memo[key] = self._image.normalizedDifference([band_a, band_b])
+        return self._memo[key]
+
+    def savi(self) -> ee.Image:
+        """SAVI = (NIR - Red) / (NIR + Red + 0.5) * 1.5, unnamed."""
+        if 'savi' not in self._memo:
+            nir, red = self.scaled('B8'), self.scaled('B4')
+            self._memo['savi'] = (
+                nir.subtract(red)
+                .divide(nir.add(red).add(self.SAVI_L))
+                .multiply(1 + self.SAVI_L)
+            )
+        return self._memo['savi']
+
 
 class IndexCalculator:
     """
@@ -35,9 +87,10 @@ class IndexCalculator:
             ee.Image with all index bands appended.
         """
         bands_to_add = []
+        shared       = _SharedBands(image)
 
         for name, cfg in INDICES_CONFIG.items():
-            band = self._compute_predefined(image, name, cfg)
+            band = self._compute_predefined(shared, name, cfg)
             if band is not None:
                 bands_to_add.append(band)
 
@@ -52,26 +105,26 @@ class IndexCalculator:
     # ── Predefined formulas ──────────────────────────────────────────────────
 
     def _compute_predefined(
-        self, image: ee.Image, name: str, cfg: dict
+        self, shared: _SharedBands, name: str, cfg: dict
     ) -> ee.Image | None:
         formula = cfg.get('formula', 'normalized_diff')
         bands   = cfg.get('bands', [])
 
         try:
             if formula == 'normalized_diff' and len(bands) >= 2:
-                return image.normalizedDifference([bands[0], bands[1]]).rename(name)
+                return shared.normalized_diff(bands[0], bands[1]).rename(name)
 
             if formula == 'evi':
-                return self._evi(image, name)
+                return self._evi(shared, name)
 
             if formula == 'savi':
-                return self._savi(image, name)
+                return self._savi(shared, name)
 
             if formula == 'bsi':
-                return self._bsi(image, name)
+                return self._bsi(shared, name)
 
             if formula == 'ibi':
-                return self._ibi(image, name)
+                return self._ibi(shared, name)
 
         except Exception:
             pass  # Band may not exist in this image; silently skip.
@@ -80,45 +133,33 @@ class IndexCalculator:
 
     # ── Named formula implementations ───────────────────────────────────────
 
-    def _evi(self, image: ee.Image, name: str) -> ee.Image:
+    def _evi(self, shared: _SharedBands, name: str) -> ee.Image:
         """EVI = 2.5 * (NIR - Red) / (NIR + 6*Red - 7.5*Blue + 1)"""
-        nir  = image.select('B8').divide(10000)
-        red  = image.select('B4').divide(10000)
-        blue = image.select('B2').divide(10000)
+        nir  = shared.scaled('B8')
+        red  = shared.scaled('B4')
+        blue = shared.scaled('B2')
         return (
             nir.subtract(red).multiply(2.5)
             .divide(nir.add(red.multiply(6)).subtract(blue.multiply(7.5)).add(1))
             .rename(name)
         )
 
-    def _savi(self, image: ee.Image, name: str) -> ee.Image:
+    def _savi(self, shared: _SharedBands, name: str) -> ee.Image:
         """SAVI = (NIR - Red) / (NIR + Red + 0.5) * 1.5"""
-        L   = 0.5
-        nir = image.select('B8').divide(10000)
-        red = image.select('B4').divide(10000)
-        return (
-            nir.subtract(red)
-            .divide(nir.add(red).add(L))
-            .multiply(1 + L)
-            .rename(name)
-        )
+        return shared.savi().rename(name)
 
-    def _bsi(self, image: ee.Image, name: str) -> ee.Image:
+    def _bsi(self, shared: _SharedBands, name: str) -> ee.Image:
         """BSI = ((SWIR1 + Red) - (NIR + Blue)) / ((SWIR1 + Red) + (NIR + Blue))"""
-        swir = image.select('B11')
-        red  = image.select('B4')
-        nir  = image.select('B8')
-        blue = image.select('B2')
-        num  = swir.add(red).subtract(nir.add(blue))
-        den  = swir.add(red).add(nir.add(blue))
-        return num.divide(den).rename(name)
-
-    def _ibi(self, image: ee.Image, name: str) -> ee.Image:
+        # A ratio, so the shared reflectance-scaled bands give the same value
+        swir_red = shared.scaled('B11').add(shared.scaled('B4'))
+        nir_blue = shared.scaled('B8').add(shared.scaled('B2'))
+        return swir_red.subtract(nir_blue).divide(swir_red.add(nir_blue)).rename(name)
+
+    def _ibi(self, shared: _SharedBands, name: str) -> ee.Image:
         """IBI = (NDBI - (SAVI + MNDWI)/2) / (NDBI + (SAVI + MNDWI)/2)"""
-        ndbi  = image.normalizedDifference(['B11', 'B8'])
-        mndwi = image.normalizedDifference(['B3', 'B11'])
-        savi  = self._savi(image, 'savi_tmp')
-        mean  = savi.add(mndwi).divide(2)
+        ndbi  = shared.normalized_diff('B11', 'B8')
+        mndwi = shared.normalized_diff('B3', 'B11')
+        mean  = shared.savi().add(mndwi).divide(2)
         return ndbi.subtract(mean).divide(ndbi.add(mean)).rename(name)
 
     # ── Custom index ─────────────────────────────────────────────────────────
@@ -153,10 +194,12 @@ class IndexCalculator:
                 )
 
             if formula == 'expression':
-                band_map = {
-                    var: image.select(band)
-                    for var, band in custom.get('expression_bands', {}).items()
-                }
+                expr_bands = custom.get('expression_bands', {})
+                # An unbound variable only fails server-side, inside the
+                # shared reduceRegion; catch it here and skip the band.
+                if not _expression_variables(custom['expression']) <= expr_bands.keys():
+                    return None
+                band_map = {var: image.select(band) for var, band in expr_bands.items()}
                 return image.expression(custom['expression'], band_map).rename(name)
 
         except Exception:
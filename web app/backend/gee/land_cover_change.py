@@ -10,6 +10,29 @@ from typing import Dict, List, Tuple
 from backend.gee.dynamic_world import DynamicWorldClassifier, DW_CLASSES, DW_NAMES
 
 
+# Classes monitored for heritage threat (built once at import, not per call)
+THREAT_CLASSES = {
+    'Built-up': {'direction': 'increase', 'weight': 10, 'threshold': 2},
+    'Bare': {'direction': 'increase', 'weight': 8, 'threshold': 3},
+    'Water': {'direction': 'increase', 'weight': 7, 'threshold': 2},
+    'Flooded': {'direction': 'increase', 'weight': 9, 'threshold': 1},
+    'Trees': {'direction': 'decrease', 'weight': 6, 'threshold': 5},
+}
+
+# Threat direction → sign applied to a class's percentage change
+_DIRECTION_SIGN = {'increase': 1, 'decrease': -1}
+
+# Transitions most damaging to heritage sites
+DANGEROUS_TRANSITIONS = (
+    ('Trees', 'Built-up'),  # Forest loss to urban
+    ('Trees', 'Bare'),  # Forest to bare soil
+    ('Grass', 'Built-up'),  # Natural to urban
+    ('Water', 'Bare'),  # Water loss
+    ('Grass', 'Bare'),  # Vegetation loss
+    ('Cropland', 'Built-up'),  # Agricultural to urban
+)
+
+
 class LandCoverChangeAnalyzer:
     """
     Analyze transitions between land cover classes over time
@@ -68,41 +91,21 @@ class LandCoverChangeAnalyzer:
         """
         critical_changes = []
 
-        # Monitor these classes for heritage threat
-        threat_classes = {
-            'Built-up': {'direction': 'increase', 'weight': 10, 'threshold': 2},
-            'Bare': {'direction': 'increase', 'weight': 8, 'threshold': 3},
-            'Water': {'direction': 'increase', 'weight': 7, 'threshold': 2},
-            'Flooded': {'direction': 'increase', 'weight': 9, 'threshold': 1},
-            'Trees': {'direction': 'decrease', 'weight': 6, 'threshold': 5},
-        }
-
-        for class_name, threat_info in threat_classes.items():
+        for class_name, threat_info in THREAT_CLASSES.items():
             before_pct = before_stats.get(class_name, {}).get('percentage', 0)
             after_pct = after_stats.get(class_name, {}).get('percentage', 0)
             change = after_pct - before_pct
 
-            # Check if change crosses threshold and is in threat direction
-            if threat_info['direction'] == 'increase':
-                if change > threat_info['threshold']:
-                    critical_changes.append({
-                        'class': class_name,
-                        'change': change,
-                        'before': before_pct,
-                        'after': after_pct,
-                        'severity': 'critical' if change > 10 else 'warning',
-                        'weight': threat_info['weight']
-                    })
-            else:  # decrease
-                if change < -threat_info['threshold']:
-                    critical_changes.append({
-                        'class': class_name,
-                        'change': change,
-                        'before': before_pct,
-                        'after': after_pct,
-                        'severity': 'critical' if abs(change) > 10 else 'warning',
-                        'weight': threat_info['weight']
-                    })
+            # Signed so a move in the threat direction is positive either way
+            if change * _DIRECTION_SIGN[threat_info['direction']] > threat_info['threshold']:
+                critical_changes.append({
+                    'class': class_name,
+                    'change': change,
+                    'before': before_pct,
+                    'after': after_pct,
+                    'severity': 'critical' if abs(change) > 10 else 'warning',
+                    'weight': threat_info['weight']
+                })
 
         # Sort by weight/severity
         critical_changes.sort(key=lambda x: abs(x['change']) * x['weight'], reverse=True)
@@ -318,16 +321,6 @@ class LandCoverChangeAnalyzer:
 
         Returns sorted list of dangerous transitions
         """
-        # Define dangerous transitions
-        dangerous = [
-            ('Trees', 'Built-up'),  # Forest loss to urban
-            ('Trees', 'Bare'),  # Forest to bare soil
-            ('Grass', 'Built-up'),  # Natural to urban
-            ('Water', 'Bare'),  # Water loss
-            ('Grass', 'Bare'),  # Vegetation loss
-            ('Cropland', 'Built-up'),  # Agricultural to urban
-        ]
-
         change_data = self.classifier.detect_class_change(
             before_classification,
             after_classification,
@@ -336,7 +329,7 @@ class LandCoverChangeAnalyzer:
 
         vulnerable = []
 
-        for from_class, to_class in dangerous:
+        for from_class, to_class in DANGEROUS_TRANSITIONS:
             trans_key = f"{from_class} → {to_class}"
             if trans_key in change_data['transitions']:
                 stats = change_data['transitions'][trans_key]
@@ -2,22 +2,58 @@
 Responsible for: computing spatial statistics over an AOI via reduceRegion.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import ee
 
 
 class StatisticsCalculator:
     """
-    Extracts median / stdDev / min / max statistics for a single index band
-    from an EE Image over a given geometry.
+    Extracts median / stdDev / min / max statistics for one or more index
+    bands from an EE Image over a given geometry.
 
     Usage:
         stats_calc = StatisticsCalculator()
-        stats = stats_calc.run(image_with_indices, aoi, 'NDVI')
+        scale = StatisticsCalculator.scale_for(buffer_km)
+        stats = stats_calc.run(image_with_indices, aoi, 'NDVI', scale)
         median = stats.get('NDVI_median')
+        all_stats = stats_calc.run_multiple(image_with_indices, aoi, ['NDVI', 'NDBI'], scale)
     """
 
     DEFAULT_SCALE     = 10      # metres — Sentinel-2 native resolution
+    # (max buffer_km, scale m): small sites keep native 10 m, large AOIs
+    # coarsen so the pixel count stays within a single reduceRegion budget
+    SCALE_BY_BUFFER   = ((2.0, 10), (5.0, 20))
+    COARSE_SCALE      = 30
     DEFAULT_MAX_PIXELS = 1e9
+    MAX_WORKERS       = 8       # concurrent reduceRegion round-trips
+
+    STAT_SUFFIXES     = ('median', 'stdDev', 'min', 'max')
+
+    _reducer: ee.Reducer | None = None   # combined reducer, see _combined_reducer
+
+    @classmethod
+    def _combined_reducer(cls) -> ee.Reducer:
+        """
+        median + stdDev + minMax sharing one pass over the pixels.
+        Built once on first use (EE must be initialised first) and reused
+        by every reduceRegion instead of re-chaining it per call.
+        """
+        if cls._reducer is None:
+            cls._reducer = (
+                ee.Reducer.median()
+                .combine(reducer2=ee.Reducer.stdDev(), sharedInputs=True)
+                .combine(reducer2=ee.Reducer.minMax(),  sharedInputs=True)
+            )
+        return cls._reducer
+
+    @classmethod
+    def scale_for(cls, buffer_km: float) -> int:
+        """Pick the reduceRegion scale (metres) for an AOI of radius *buffer_km*."""
+        for max_buffer, scale in cls.SCALE_BY_BUFFER:
+            if buffer_km <= max_buffer:
+                return scale
+        return cls.COARSE_SCALE
 
     def run(
         self,
@@ -36,21 +72,11 @@ class StatisticsCalculator:
             scale:    Spatial resolution in metres for reduceRegion.
 
         Returns:
-            Dict with keys like 'NDVI_mean', 'NDVI_stdDev', 'NDVI_min', 'NDVI_max'.
+            Dict with keys like 'NDVI_median', 'NDVI_stdDev', 'NDVI_min', 'NDVI_max'.
             Returns empty dict if the band is missing or the call fails.
         """
         try:
-            stats = image.select(index).reduceRegion(
-                reducer=(
-                    ee.Reducer.median()
-                    .combine(reducer2=ee.Reducer.stdDev(), sharedInputs=True)
-                    .combine(reducer2=ee.Reducer.minMax(),  sharedInputs=True)
-                ),
-                geometry=geometry,
-                scale=scale,
-                maxPixels=self.DEFAULT_MAX_PIXELS,
-            )
-            return stats.getInfo()
+            return self._reduce(image.select(index), geometry, scale).getInfo()
         except Exception:
             return {}
 
@@ -59,11 +85,129 @@ class StatisticsCalculator:
         image: ee.Image,
         geometry: ee.Geometry,
         indices: list[str],
+        scale: int = DEFAULT_SCALE,
     ) -> dict[str, dict]:
         """
-        Convenience wrapper: run stats for every index in *indices*.
+        Run stats for every index in *indices* with a single reduceRegion
+        over the stacked index bands — one pixel pass and one round-trip
+        instead of one per index.
+
+        If the fused call fails (e.g. one custom band cannot be computed),
+        falls back to per-index calls issued concurrently, so one bad band
+        does not cost the others their statistics.
 
         Returns:
             Dict keyed by index name, each value is the stats dict from run().
         """
-        return {idx: self.run(image, geometry, idx) for idx in indices}
\ No newline at end of file
+        if not indices:
+            return {}
+        try:
+            flat = self._reduce(image.select(list(indices)), geometry, scale).getInfo()
+        except Exception:
+            return self._run_each(image, geometry, indices, scale)
+        return {
+            idx: {
+                f'{idx}_{suffix}': flat.get(f'{idx}_{suffix}')
+                for suffix in self.STAT_SUFFIXES
+            }
+            for idx in indices
+        }
+
+    def run_pair(
+        self,
+        before: ee.Image,
+        after: ee.Image,
+        geometry: ee.Geometry,
+        index: str,
+        scale: int = DEFAULT_SCALE,
+    ) -> tuple[dict, dict]:
+        """
+        Stats for *index* on two images with one reduceRegion over the
+        stacked 'before' / 'after' bands instead of two round-trips.
+
+        Returns:
+            (before_stats, after_stats), each shaped like run().
+            Two empty dicts if the call fails.
+        """
+        stacked = ee.Image.cat([
+            before.select(index).rename('before'),
+            after.select(index).rename('after'),
+        ])
+        try:
+            flat = self._reduce(stacked, geometry, scale).getInfo()
+        except Exception:
+            return {}, {}
+        before_stats, after_stats = (
+            {f'{index}_{suffix}': flat.get(f'{band}_{suffix}') for suffix in self.STAT_SUFFIXES}
+            for band in ('before', 'after')
+        )
+        return before_stats, after_stats
+
+    def run_series(
+        self,
+        collection: ee.ImageCollection,
+        geometry: ee.Geometry,
+        index: str | list[str],
+        scale: int = DEFAULT_SCALE,
+    ) -> dict[int, dict]:
+        """
+        Run stats for one or more indices on every image of *collection* in
+        one server-side sweep (collection.map + a single getInfo) instead of
+        one reduceRegion round-trip per image and index.
+
+        Args:
+            collection: ImageCollection whose images already carry the index bands.
+            geometry:   Area of interest.
+            index:      Band name, or list of band names, to summarise.
+            scale:      Spatial resolution in metres for reduceRegion.
+
+        Returns:
+            Dict keyed by 'system:time_start' (ms), each value a flat stats
+            dict with '<index>_<stat>' keys for every requested index.
+            Empty dict if the call fails.
+        """
+        indices = [index] if isinstance(index, str) else list(index)
+
+        def _reduce_image(img):
+            return ee.Feature(
+                None, self._reduce(img.select(indices), geometry, scale)
+            ).set('system:time_start', img.get('system:time_start'))
+
+        try:
+            features = ee.FeatureCollection(collection.map(_reduce_image)).getInfo()
+        except Exception:
+            return {}
+        return {
+            f['properties']['system:time_start']: {
+                f'{idx}_{suffix}': f['properties'].get(f'{idx}_{suffix}')
+                for idx in indices
+                for suffix in self.STAT_SUFFIXES
+            }
+            for f in features.get('features', [])
+        }
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    def _reduce(self, image: ee.Image, geometry: ee.Geometry, scale: int) -> ee.Dictionary:
+        return image.reduceRegion(
+            reducer=self._combined_reducer(),
+            geometry=geometry,
+            scale=scale,
+            maxPixels=self.DEFAULT_MAX_PIXELS,
+            bestEffort=True,
+        )
+
+    def _run_each(
+        self,
+        image: ee.Image,
+        geometry: ee.Geometry,
+        indices: list[str],
+        scale: int,
+    ) -> dict[str, dict]:
+        workers = min(self.MAX_WORKERS, len(indices))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                idx: pool.submit(self.run, image, geometry, idx, scale)
+                for idx in indices
+            }
+            return {idx: future.result() for idx, future in futures.items()}
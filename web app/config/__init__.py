@@ -1,4 +1,4 @@
 from .settings import *
-from .indices_config import INDICES_CONFIG, SENTINEL2_BANDS
+from .indices_config import INDICES_CONFIG, INDICES_BY_CATEGORY, SENTINEL2_BANDS
 from .site_presets import SITE_PRESETS
 from .theme import THEME_CSS
\ No newline at end of file
@@ -169,4 +169,9 @@ INDICES_CONFIG = {
         'description': 'Highlights recently burned areas.',
         'heritage_use': 'Post-fire damage mapping around heritage sites.',
     },
-}
\ No newline at end of file
+}
+
+# Category → index keys, inverted once at import for the sidebar filter
+INDICES_BY_CATEGORY = {'All': list(INDICES_CONFIG.keys())}
+for _key, _cfg in INDICES_CONFIG.items():
+    INDICES_BY_CATEGORY.setdefault(_cfg['category'], []).append(_key)
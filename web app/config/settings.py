@@ -11,6 +11,7 @@ PAGE_CONFIG = {
 
 # Earth Engine
 EE_PROJECT_ID = "first-project-481215"
+EE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
 
 # Data acquisition defaults
 DEFAULT_CLOUD_COVER = 20
@@ -2,7 +2,25 @@
 Application theme — CSS only
 """
 
-THEME_CSS = """
+import re
+
+
+def _minify(css: str) -> str:
+    """
+    Strip comments and layout whitespace once at import time, so every
+    rerun ships a compact single-line <style> block to the browser.
+    Only whitespace around braces, semicolons, commas and child
+    combinators (and after colons) is dropped; descendant-selector
+    spaces are kept.
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.strip()
+
+
+THEME_CSS = _minify("""
 <style>
 
 /* ── VARIABLES ───────────────────────────────────────────── */
@@ -144,4 +162,62 @@ code, pre { background: #2c2040 !important; color: var(--yellow) !important; bor
 }
 
 </style>
-"""
\ No newline at end of file
+""")
+
+
+# ── Tab-scoped styles ────────────────────────────────────────
+# These restyle generic Streamlit widgets (every secondary button / column
+# button), so they are emitted only by the tab that needs them rather than
+# merged into THEME_CSS, where they would leak into every other tab.
+
+# Maps tab: invisible buttons stacked over the view-mode cards
+MAPS_MODE_BUTTON_CSS = _minify("""
+<style>
+div[data-testid="stHorizontalBlock"] button[kind="secondary"] {
+    position: relative !important;
+    opacity: 0 !important;
+    height: 50px !important;
+    margin-top: -54px !important;
+    width: 100% !important;
+    cursor: pointer !important;
+    z-index: 10 !important;
+}
+</style>
+""")
+
+# History tab: render st.button as a session card
+HISTORY_CARD_CSS = _minify("""
+<style>
+[data-testid="stHorizontalBlock"] { gap: 0 !important; }
+div[data-testid="column"] > div > div > div > button {
+    background: transparent !important;
+    border: none !important;
+    padding: 0 !important;
+    height: auto !important;
+}
+.hist-card {
+    border: 1.5px solid #e0d6f0;
+    border-radius: 10px;
+    padding: 12px 14px;
+    margin-bottom: 6px;
+    background: #faf7fd;
+    cursor: pointer;
+    transition: border-color 0.15s;
+}
+.hist-card:hover { border-color: #764ba2; }
+.hist-card.active {
+    background: linear-gradient(135deg,#4a2d6b,#764ba2);
+    border-color: #764ba2;
+}
+.hist-card .title  { font-weight:700; font-size:14px; color:#2c2c3e; }
+.hist-card.active .title,
+.hist-card.active .sub,
+.hist-card.active .tiny { color: white !important; opacity: 1 !important; }
+.hist-card .sub    { font-size:11px; color:#6b6b8a; margin-top:3px; }
+.hist-card .tiny   { font-size:10px; color:#6b6b8a; margin-top:2px; opacity:0.8; }
+.badge-y { background:#f0c040; color:#2c2c3e; font-size:10px; font-weight:700;
+           padding:1px 7px; border-radius:10px; margin-left:6px; }
+.badge-p { background:#9b6fc5; color:white; font-size:10px; font-weight:700;
+           padding:1px 7px; border-radius:10px; margin-left:4px; }
+</style>
+""")
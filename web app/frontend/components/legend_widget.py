@@ -2,8 +2,40 @@
 Responsible for: rendering the spectral indices colour-scale legend.
 """
 
+from functools import lru_cache
+
 import streamlit as st
 from config.indices_config import INDICES_CONFIG
+from utils.palette_utils import PaletteUtils
+
+
+_PREDEFINED_CARD_HTML = (
+    '<details style="border:1px solid #e0dbe8;border-radius:6px;padding:6px 12px;margin-bottom:8px;">'
+    '<summary><strong>{idx}</strong> — {name}</summary>'
+    '<div style="display:flex;gap:16px;padding-top:8px;">'
+    '<div style="flex:1;">'
+    '<div style="background:linear-gradient(to right,{grad});height:16px;'
+    'border-radius:4px;border:1px solid #ccc;"></div>'
+    '<div style="display:flex;justify-content:space-between;font-size:11px;">'
+    '<span>{min}</span><span>{max}</span></div>'
+    '</div>'
+    '<div style="flex:2;">'
+    '<p style="margin:0;">{description}</p>'
+    '<p style="margin:4px 0 0 0;font-size:12px;color:#6b6b8a;">{heritage_use}</p>'
+    '</div>'
+    '</div>'
+    '</details>'
+)
+
+
+@lru_cache(maxsize=None)
+def _predefined_card_html(idx: str) -> str:
+    idc = INDICES_CONFIG[idx]
+    return _PREDEFINED_CARD_HTML.format(
+        idx=idx, name=idc['name'], grad=PaletteUtils.gradient_css(idc['palette']),
+        min=idc['min'], max=idc['max'],
+        description=idc.get('description', ''), heritage_use=idc.get('heritage_use', ''),
+    )
 
 
 class LegendWidget:
@@ -15,38 +47,30 @@ class LegendWidget:
         legend.render()
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, custom_map: dict | None = None):
         self._config     = config
-        self._custom_map = {c['name']: c for c in config.get('custom_indices', [])}
+        self._custom_map = (
+            custom_map if custom_map is not None
+            else {c['name']: c for c in config.get('custom_indices', [])}
+        )
 
     def render(self) -> None:
         st.markdown('---')
         st.markdown('### Spectral Indices Guide')
+        # Predefined cards are static: one HTML block instead of an expander each
+        predefined = [
+            _predefined_card_html(idx) for idx in self._config['indices']
+            if idx not in self._custom_map and idx in INDICES_CONFIG
+        ]
+        if predefined:
+            st.markdown(''.join(predefined), unsafe_allow_html=True)
+
         for idx in self._config['indices']:
             if idx in self._custom_map:
                 self._render_custom_card(idx)
-            elif idx in INDICES_CONFIG:
-                self._render_predefined_card(idx)
 
     # ── Private ──────────────────────────────────────────────────────────────
 
-    def _render_predefined_card(self, idx: str) -> None:
-        idc = INDICES_CONFIG[idx]
-        with st.expander(f"**{idx}** — {idc['name']}", expanded=False):
-            col1, col2 = st.columns([1, 2])
-            with col1:
-                grad = self._gradient_css(idc['palette'])
-                st.markdown(
-                    f'<div style="background:linear-gradient(to right,{grad});height:16px;'
-                    f'border-radius:4px;border:1px solid #ccc;"></div>'
-                    f'<div style="display:flex;justify-content:space-between;font-size:11px;">'
-                    f'<span>{idc["min"]}</span><span>{idc["max"]}</span></div>',
-                    unsafe_allow_html=True,
-                )
-            with col2:
-                st.markdown(idc.get('description', ''))
-                st.caption(idc.get('heritage_use', ''))
-
     def _render_custom_card(self, idx: str) -> None:
         ci = self._custom_map[idx]
         with st.expander(f"**{idx}** — Custom Index", expanded=False):
@@ -65,9 +89,4 @@ class LegendWidget:
                     st.code(ci.get('expression', ''))
                 st.caption(f"Range: {ci.get('min', -1)} to {ci.get('max', 1)}")
             with col2:
-                st.info(ci.get('description', 'User-defined custom spectral index.'))
-
-    @staticmethod
-    def _gradient_css(palette: list[str]) -> str:
-        colors = ['#' + p if not p.startswith('#') else p for p in palette]
-        return ', '.join(colors)
\ No newline at end of file
+                st.info(ci.get('description', 'User-defined custom spectral index.'))
\ No newline at end of file
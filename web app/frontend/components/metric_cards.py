@@ -2,6 +2,7 @@
 Responsible for: rendering styled HTML metric cards in Streamlit.
 """
 
+import pandas as pd
 import streamlit as st
 
 
@@ -55,14 +56,16 @@ class MetricCards:
 
     def render_stats_row(self, stats: dict, index_name: str) -> None:
         """
-        Render a row of four st.metric widgets (mmedian / std / min / max).
+        Render median / std / min / max as a single one-row table.
 
         Args:
             stats:      Dict returned by StatisticsCalculator.run().
             index_name: Used to look up keys like 'NDVI_median'.
         """
-        c1, c2, c3, c4 = st.columns(4)
-        c1.metric('Median',          f"{stats.get(f'{index_name}_median',   0):.4f}")
-        c2.metric('Std Deviation', f"{stats.get(f'{index_name}_stdDev', 0):.4f}")
-        c3.metric('Minimum',       f"{stats.get(f'{index_name}_min',    0):.4f}")
-        c4.metric('Maximum',       f"{stats.get(f'{index_name}_max',    0):.4f}")
\ No newline at end of file
+        row = pd.DataFrame([{
+            'Median':        stats.get(f'{index_name}_median', 0),
+            'Std Deviation': stats.get(f'{index_name}_stdDev', 0),
+            'Minimum':       stats.get(f'{index_name}_min',    0),
+            'Maximum':       stats.get(f'{index_name}_max',    0),
+        }]).round(4)
+        st.dataframe(row, use_container_width=True, hide_index=True)
\ No newline at end of file
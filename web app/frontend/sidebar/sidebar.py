@@ -9,7 +9,7 @@ from config.settings import (
     DEFAULT_CLOUD_COVER, INDEX_CATEGORIES, AVAILABLE_PALETTES
 )
 from config.site_presets import SITE_PRESETS
-from config.indices_config import INDICES_CONFIG, SENTINEL2_BANDS
+from config.indices_config import INDICES_BY_CATEGORY, SENTINEL2_BANDS
 from frontend.components.index_description import IndexDescription
 
 
@@ -41,8 +41,9 @@ class Sidebar:
             run_analysis = self._render_run_button()
 
         # Merge custom index names into indices list
-        all_indices = list(indices)
-        for ci in st.session_state.get('custom_indices', []):
+        custom_indices = list(st.session_state.get('custom_indices', {}).values())
+        all_indices    = list(indices)
+        for ci in custom_indices:
             if ci['name'] not in all_indices:
                 all_indices.append(ci['name'])
 
@@ -55,7 +56,7 @@ class Sidebar:
             'end_date':         end_date,
             'cloud_cover':      cloud_cover,
             'indices':          all_indices,
-            'custom_indices':   st.session_state.get('custom_indices', []),
+            'custom_indices':   custom_indices,
             'run_analysis':     run_analysis,
             'change_threshold': change_threshold,
             'sample_size':      sample_size,
@@ -143,13 +144,7 @@ class Sidebar:
             ['All'] + [c for c in INDEX_CATEGORIES if c != 'Custom'],
         )
 
-        if selected_category == 'All':
-            available = list(INDICES_CONFIG.keys())
-        else:
-            available = [
-                k for k, v in INDICES_CONFIG.items()
-                if v.get('category') == selected_category
-            ]
+        available = INDICES_BY_CATEGORY.get(selected_category, [])
 
         IndexDescription(available).render()
 
@@ -248,29 +243,22 @@ class Sidebar:
 
             if st.button('Add Custom Index to Analysis', use_container_width=True):
                 if custom_name and custom_def:
-                    if 'custom_indices' not in st.session_state:
-                        st.session_state.custom_indices = []
-                    st.session_state.custom_indices = [
-                        c for c in st.session_state.custom_indices
-                        if c['name'] != custom_name
-                    ]
-                    st.session_state.custom_indices.append(custom_def)
+                    # Keyed by name: re-adding an index replaces its definition
+                    st.session_state.setdefault('custom_indices', {})
+                    st.session_state.custom_indices[custom_name] = custom_def
                     indices.append(custom_name)
                     st.success(f' {custom_name} added!')
 
             # List active custom indices with remove buttons
             if st.session_state.get('custom_indices'):
                 st.markdown('**Active custom indices:**')
-                for ci in st.session_state.custom_indices:
+                for name, ci in list(st.session_state.custom_indices.items()):
                     col_name, col_rm = st.columns([3, 1])
                     with col_name:
-                        st.caption(f"**{ci['name']}** — {ci.get('formula', '')}")
+                        st.caption(f"**{name}** — {ci.get('formula', '')}")
                     with col_rm:
-                        if st.button('✕', key=f"rm_{ci['name']}"):
-                            st.session_state.custom_indices = [
-                                c for c in st.session_state.custom_indices
-                                if c['name'] != ci['name']
-                            ]
+                        if st.button('✕', key=f'rm_{name}'):
+                            st.session_state.custom_indices.pop(name, None)
                             st.rerun()
 
         return indices
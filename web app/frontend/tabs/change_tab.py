@@ -2,36 +2,120 @@
 Responsible for: rendering the Change Detection tab.
 """
 
+import hashlib
+import json
+import logging
+import time
+
 import streamlit as st
+import streamlit.components.v1 as components
 import folium
+import pandas as pd
 import ee
 from datetime import datetime
 
-import geemap.foliumap as geemap
-
 from config.indices_config import INDICES_CONFIG
+from backend.gee.collection_builder import CollectionBuilder
 from backend.gee.index_calculator import IndexCalculator
 from backend.gee.statistics_calculator import StatisticsCalculator
 from backend.gee.change_detector import (
     ChangeDetector, SEVERITY_COLOR, SEVERITY_LABEL
 )
 from backend.ai.ai_interpreter import AIInterpreter
-from utils.date_utils import DateUtils
-from utils.visualization import ChartBuilder
-from frontend.components.map_widget import MapWidget
+from utils.hash_utils import HashUtils
+from utils.palette_utils import PaletteUtils
+from utils.streamlit_utils import EE_HASH_FUNCS, bump_history_version, fragment
+
+
+# Marker popup template, filled with str.format per event. Kept compact at
+# module level: the old indented f-string shipped its whitespace per marker.
+_EVENT_POPUP_HTML = (
+    '<div style="font-family:Arial,sans-serif;min-width:200px;padding:4px;">'
+    '<div style="font-weight:700;font-size:13px;color:#{color};margin-bottom:4px;">'
+    '{sev_label} — {idx}</div>'
+    '<table style="font-size:12px;width:100%;">'
+    '<tr><td style="color:#666;">Before ({first_date}):</td><td><b>{ev[value_before]:.4f}</b></td></tr>'
+    '<tr><td style="color:#666;">After ({last_date}):</td><td><b>{ev[value_after]:.4f}</b></td></tr>'
+    '<tr><td style="color:#666;">Change (Δ):</td>'
+    '<td><b style="color:{delta_color}">{ev[delta]:+.4f}</b></td></tr>'
+    '<tr><td style="color:#666;">Location:</td><td>{ev[lat]:.5f}°N, {ev[lon]:.5f}°E</td></tr>'
+    '</table></div>'
+)
+
+
+# One events-table row; the cell styles are parsed once, not per f-string
+_EVENT_ROW_HTML = (
+    '<tr style="border-bottom:1px solid #f0f0f5;">'
+    '<td style="padding:4px 6px;font-weight:700;color:#764ba2;">{n}</td>'
+    '<td style="padding:4px 6px;color:{sev_color};font-weight:600;">{sev_label}</td>'
+    '<td style="padding:4px 6px;font-size:12px;color:#666;">{ev[lat]:.4f}°N<br>{ev[lon]:.4f}°E</td>'
+    '<td style="padding:4px 6px;"><code>{ev[value_before]:.4f}</code></td>'
+    '<td style="padding:4px 6px;"><code>{ev[value_after]:.4f}</code></td>'
+    '<td style="padding:4px 6px;color:{delta_color};font-weight:700;">{ev[delta]:+.4f}</td>'
+    '<td style="padding:4px 6px;">{direction}</td>'
+    '<td style="padding:4px 6px;font-size:12px;color:#666;">{ev[label]}</td>'
+    '</tr>'
+)
+
+
+# ── Cached EE round-trips ─────────────────────────────────────────────────────
+# Keyed on the serialised EE graphs, so a threshold or index change reruns
+# only the calls whose inputs actually changed.
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=EE_HASH_FUNCS)
+def _collection_date_range(collection: ee.ImageCollection) -> tuple[str, str]:
+    return CollectionBuilder().get_date_range(collection)
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=EE_HASH_FUNCS)
+def _pair_stats(first_image: ee.Image, last_image: ee.Image, aoi: ee.Geometry,
+                idx: str, scale: int) -> tuple[dict, dict]:
+    return StatisticsCalculator().run_pair(first_image, last_image, aoi, idx, scale)
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=8, hash_funcs=EE_HASH_FUNCS)
+def _change_arrays(first_image: ee.Image, last_image: ee.Image, idx: str,
+                   lat: float, lon: float, buffer_km: float) -> tuple:
+    return ChangeDetector().fetch_change_arrays(first_image, last_image, idx, lat, lon, buffer_km)
+
+
+logger = logging.getLogger(__name__)
+
+# getMapId tile URLs expire server-side; anything embedding one must not
+# outlive this
+TILE_URL_TTL = 3600
+
+
+@st.cache_data(ttl=TILE_URL_TTL, show_spinner=False, hash_funcs=EE_HASH_FUNCS)
+def _tile_url(image: ee.Image, vis_params: dict) -> str:
+    return image.getMapId(vis_params)['tile_fetcher'].url_format
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=EE_HASH_FUNCS)
+def _change_events(first_image: ee.Image, last_image: ee.Image, aoi: ee.Geometry,
+                   idx: str, threshold: float) -> list[dict]:
+    return ChangeDetector().sample_change_points(first_image, last_image, aoi, idx, threshold)
+
+
+class _AIUnavailable(Exception):
+    """Raised inside the cached call so a failed LLM request is not memoised."""
 
-try:
-    from streamlit_folium import st_folium
-    _HAS_ST_FOLIUM = True
-except ImportError:
-    _HAS_ST_FOLIUM = False
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _ai_interpretation(idx: str, before_mean: float, after_mean: float, context: str) -> str:
+    text = AIInterpreter().interpret(
+        index_name=idx, before_mean=before_mean, after_mean=after_mean, context=context,
+    )
+    if text == AIInterpreter.FALLBACK_MSG:
+        raise _AIUnavailable
+    return text
 
 
 class ChangeTab:
     """
     Renders the Change Detection tab:
-    - Split map (before / after index overlay)
-    - Annotated change map with sampled event markers
+    - One map: before / after split view, toggleable change overlay and
+      sampled event markers
     - Events table
     - Statistical comparison
     - AI interpretation
@@ -41,18 +125,22 @@ class ChangeTab:
         tab.render()
     """
 
+    THRESHOLD_KEY     = 'change_threshold'
+    DEFAULT_THRESHOLD = 0.20
+    MAP_HTML_KEY      = 'change_map_html'
+    MAP_HTML_MAX      = 8     # rendered maps kept per session
+
     def __init__(self, results: dict, history_repo=None):
         self._config       = results['config']
         self._collection   = results['collection']
         self._aoi          = results['aoi']
+        self._aoi_style    = results['aoi_style']
         self._count        = results['count']
+        self._custom_map   = results.get('custom_index_map', {})
         self._history_repo = history_repo          # HistoryRepository | None
         self._calc         = IndexCalculator()
-        self._stats_calc   = StatisticsCalculator()
+        self._scale        = StatisticsCalculator.scale_for(self._config['buffer_km'])
         self._detector     = ChangeDetector()
-        self._ai           = AIInterpreter()
-        self._charts       = ChartBuilder()
-        self._widget       = MapWidget(self._config['center_lat'], self._config['center_lon'])
 
     def render(self) -> None:
         st.subheader('Change Detection & AI Insights')
@@ -64,91 +152,104 @@ class ChangeTab:
         first_image, last_image, first_date, last_date = self._load_boundary_images()
         st.info(f'Comparing: {first_date} → {last_date}')
 
-        change_index, threshold = self._render_controls()
+        change_index = self._render_index_selector()
         vis_rgb   = {'bands': ['B4', 'B3', 'B2'], 'min': 0, 'max': 3000, 'gamma': 1.4}
         vis_index = self._get_vis_params(change_index)
 
-        self._render_split_map(first_image, last_image, change_index, vis_rgb, vis_index,
-                               first_date, last_date)
-        self._render_palette_bar(change_index, vis_index)
-
-        st.markdown('### Change Detection Map')
-        st.caption(f'Click markers for details · Threshold: ±{threshold}')
+        # Threshold-dependent block reruns on its own when the slider moves
+        self._render_change_block(first_image, last_image, change_index,
+                                  vis_rgb, vis_index, first_date, last_date)
 
-        with st.spinner('Detecting significant change locations...'):
-            events = self._detector.sample_change_points(
-                first_image, last_image, self._aoi, change_index, threshold
-            )
-
-        self._render_annotated_map(first_image, last_image, change_index, threshold,
-                                   first_date, last_date, events)
-        self._render_change_legend()
-        st.markdown('---')
-        self._render_events_table(events, change_index, first_date, last_date)
         before_stats, after_stats = self._render_stats_comparison(
             first_image, last_image, change_index, first_date, last_date
         )
         ai_text = self._render_ai_section(first_image, last_image, change_index,
                                           before_stats, after_stats)
+
+        threshold = st.session_state.get(self.THRESHOLD_KEY, self.DEFAULT_THRESHOLD)
+        events    = _change_events(first_image, last_image, self._aoi, change_index, threshold)
         self._auto_save_snapshot(
             change_index, threshold, first_date, last_date,
             before_stats, after_stats, events, ai_text,
         )
 
+    @fragment
+    def _render_change_block(self, first_image, last_image, change_index,
+                             vis_rgb, vis_index, first_date, last_date) -> None:
+        threshold = self._render_threshold_slider()
+
+        st.markdown('### Before vs After & Change Detection Map')
+        st.caption(
+            f'Left: **{first_date}** | Right: **{last_date}** | Overlay: **{change_index}** · '
+            f'Toggle the change layer in the layer menu · Click markers for details · '
+            f'Threshold: ±{threshold}'
+        )
+
+        with st.spinner('Detecting significant change locations...'):
+            events = _change_events(
+                first_image, last_image, self._aoi, change_index, threshold
+            )
+
+        self._render_change_map(first_image, last_image, change_index, threshold,
+                                vis_rgb, vis_index, first_date, last_date, events)
+        self._render_palette_bar(change_index, vis_index)
+        self._render_change_legend()
+        self._render_local_change_summary(first_image, last_image, change_index, threshold)
+        st.markdown('---')
+        self._render_events_table(events, change_index, first_date, last_date)
+
     # ── Data loading ─────────────────────────────────────────────────────────
 
     def _load_boundary_images(self):
-        extra      = self._config.get('custom_indices', [])
-        image_list = self._collection.toList(self._collection.size())
-        dates      = self._collection.aggregate_array('system:time_start').getInfo()
+        extra       = self._config.get('custom_indices', [])
 
-        first_image = self._calc.compute(ee.Image(image_list.get(0)), extra_indices=extra)
-        last_image  = self._calc.compute(ee.Image(image_list.get(self._count - 1)), extra_indices=extra)
-        first_date  = DateUtils.from_timestamp_ms(dates[0]).strftime('%Y-%m-%d')
-        last_date   = DateUtils.from_timestamp_ms(dates[-1]).strftime('%Y-%m-%d')
+        # Earliest / latest by acquisition time — no toList() over the whole collection
+        by_time     = self._collection.sort('system:time_start')
+        first_image = self._calc.compute(ee.Image(by_time.first()), extra_indices=extra)
+        last_image  = self._calc.compute(
+            ee.Image(self._collection.sort('system:time_start', False).first()), extra_indices=extra
+        )
+        first_date, last_date = _collection_date_range(self._collection)
 
         return first_image, last_image, first_date, last_date
 
     # ── Controls ─────────────────────────────────────────────────────────────
 
-    def _render_controls(self) -> tuple[str, float]:
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            change_index = st.selectbox('Select Index for Change Detection', self._config['indices'])
-        with col2:
-            threshold = st.slider('Change Threshold', 0.05, 0.5, 0.20, 0.05)
-        return change_index, threshold
+    def _render_index_selector(self) -> str:
+        return st.selectbox('Select Index for Change Detection', self._config['indices'])
+
+    def _render_threshold_slider(self) -> float:
+        return st.slider('Change Threshold', 0.05, 0.5, self.DEFAULT_THRESHOLD, 0.05,
+                         key=self.THRESHOLD_KEY)
 
-    # ── Split map ─────────────────────────────────────────────────────────────
+    # ── Before / after split + change map ────────────────────────────────────
+    # One map carries the split view, the change overlay and the event
+    # markers, so basemap tiles and the folium payload are built only once.
 
-    def _render_split_map(self, first_image, last_image, idx, vis_rgb, vis_index,
+    def _add_split_layers(self, m, first_image, last_image, idx, vis_rgb, vis_index,
                           first_date, last_date) -> None:
-        st.markdown('### Before vs After — Index Overlay (Split View)')
-        st.caption(f'Left: **{first_date}** | Right: **{last_date}** | Overlay: **{idx}**')
+        blend_params = {'bands': ['vis-red', 'vis-green', 'vis-blue'], 'min': 0, 'max': 255}
+
+        def blend(img):
+            rgb_vis = img.visualize(**vis_rgb)
+            idx_vis = img.select(idx).visualize(**vis_index)
+            return (
+                rgb_vis.expression('a * 0.55 + b * 0.45', {'a': rgb_vis, 'b': idx_vis})
+                .rename(blend_params['bands'])
+                .toUint8()
+            )
+
+        def tile_layer(img, name):
+            return folium.TileLayer(
+                tiles=_tile_url(blend(img), blend_params),
+                attr='Google Earth Engine', name=name, overlay=True,
+            )
 
         try:
-            blend_params = {'bands': ['vis-red', 'vis-green', 'vis-blue'], 'min': 0, 'max': 255}
-
-            def blend(img):
-                rgb_vis = img.visualize(**vis_rgb)
-                idx_vis = img.select(idx).visualize(**vis_index)
-                return rgb_vis.multiply(0.55).add(idx_vis.multiply(0.45)).toUint8()
-
-            before_blend = blend(first_image)
-            after_blend  = blend(last_image)
-
-            center = [self._config['center_lat'], self._config['center_lon']]
-            m = geemap.Map(center=center, zoom=14, add_google_map=False)
-            m.add_basemap('HYBRID')
-            left  = geemap.ee_tile_layer(before_blend, blend_params, f'Before {idx}: {first_date}')
-            right = geemap.ee_tile_layer(after_blend,  blend_params, f'After {idx}: {last_date}')
-            m.split_map(left_layer=left, right_layer=right)
-            m.centerObject(self._aoi, 14)
-
-            if _HAS_ST_FOLIUM:
-                st_folium(m, height=520, width='100%', returned_objects=[])
-            else:
-                m.to_streamlit(height=520)
+            m.split_map(
+                left_layer=tile_layer(first_image, f'Before {idx}: {first_date}'),
+                right_layer=tile_layer(last_image, f'After {idx}: {last_date}'),
+            )
         except Exception as e:
             st.error(f'Split map error: {e}')
 
@@ -156,8 +257,7 @@ class ChangeTab:
         palette = vis_index.get('palette', [])
         if not palette:
             return
-        hex_colors = ['#' + p if not p.startswith('#') else p for p in palette]
-        grad = ', '.join(hex_colors)
+        grad = PaletteUtils.gradient_css(palette)
         st.markdown(f"""
         <div style="display:flex;align-items:center;gap:8px;padding:6px 0 16px 0;font-size:13px;">
             <strong>{idx} scale:</strong>
@@ -170,22 +270,51 @@ class ChangeTab:
         </div>
         """, unsafe_allow_html=True)
 
-    # ── Annotated change map ─────────────────────────────────────────────────
+    def _render_change_map(self, first_image, last_image, idx, threshold,
+                           vis_rgb, vis_index, first_date, last_date, events) -> None:
+        """
+        Render the combined map, reusing its serialised HTML from session
+        state when none of its inputs changed — no rebuild, no re-render.
+        Entries expire with the tile URLs embedded in them (TILE_URL_TTL).
+        """
+        config = self._config
+        key = hashlib.md5(json.dumps(
+            [HashUtils.hash_config(config), idx, threshold,
+             vis_index, self._custom_map.get(idx), first_date, last_date,
+             # exact AOI: the hash rounds coordinates, the outline must not
+             config['center_lat'], config['center_lon'], config['buffer_km']],
+            sort_keys=True, default=str,
+        ).encode()).hexdigest()
+
+        cache = st.session_state.setdefault(self.MAP_HTML_KEY, {})
+        now   = time.monotonic()
+        for stale in [k for k, (_, built) in cache.items() if now - built >= TILE_URL_TTL]:
+            del cache[stale]
+
+        entry = cache.get(key)
+        if entry is None:
+            m = self._build_change_map(first_image, last_image, idx, threshold,
+                                       vis_rgb, vis_index, first_date, last_date, events)
+            entry = cache[key] = (m.get_root().render(), now)
+            while len(cache) > self.MAP_HTML_MAX:
+                cache.pop(next(iter(cache)))
+        html = entry[0]
+
+        components.html(html, height=540)
+
+    def _build_change_map(self, first_image, last_image, idx, threshold,
+                          vis_rgb, vis_index, first_date, last_date, events):
+        import geemap.foliumap as geemap   # deferred: only the map needs it
 
-    def _render_annotated_map(self, first_image, last_image, idx, threshold,
-                              first_date, last_date, events) -> None:
-        overlay = self._detector.build_change_overlay(first_image, last_image, idx, threshold)
         center  = [self._config['center_lat'], self._config['center_lon']]
 
         m = geemap.Map(center=center, zoom=14, add_google_map=False)
         m.add_basemap('HYBRID')
-        m.addLayer(overlay, {'bands': ['vis-red', 'vis-green', 'vis-blue'], 'min': 0, 'max': 255},
-                   f'RGB + {idx} Changes')
+        self._add_split_layers(m, first_image, last_image, idx, vis_rgb, vis_index,
+                               first_date, last_date)
+        self._add_change_overlay(m, first_image, last_image, idx, threshold)
 
-        aoi_style = ee.FeatureCollection(self._aoi).style(
-            color='764ba2', fillColor='764ba200', width=2
-        )
-        m.addLayer(aoi_style, {}, 'AOI')
+        m.addLayer(self._aoi_style, {}, 'AOI')
 
         for i, ev in enumerate(events):
             color      = SEVERITY_COLOR[ev['severity']].lstrip('#')
@@ -210,31 +339,70 @@ class ChangeTab:
             ).add_to(m)
 
         m.add_layer_control()
-        m.centerObject(self._aoi, 14)
+        m.set_center(self._config['center_lon'], self._config['center_lat'], 14)
+        return m
 
-        if _HAS_ST_FOLIUM:
-            st_folium(m, height=540, width='100%', returned_objects=[])
-        else:
-            m.to_streamlit(height=540)
+    def _add_change_overlay(self, m, first_image, last_image, idx, threshold) -> None:
+        """
+        Small AOIs: one cached computePixels fetch, blended in NumPy and shown
+        as a static ImageOverlay — threshold changes never touch EE again.
+        Larger AOIs (or a failed fetch) fall back to EE-computed tiles.
+        Hidden by default so the split view underneath stays visible.
+        """
+        name = f'RGB + {idx} Changes'
+        if self._config['buffer_km'] <= ChangeDetector.LOCAL_MAX_BUFFER_KM:
+            try:
+                rgb, delta, bounds = _change_arrays(
+                    first_image, last_image, idx,
+                    self._config['center_lat'], self._config['center_lon'],
+                    self._config['buffer_km'],
+                )
+                folium.raster_layers.ImageOverlay(
+                    image=ChangeDetector.blend_change_arrays(rgb, delta, threshold),
+                    bounds=bounds, name=name, show=False,
+                ).add_to(m)
+                return
+            except Exception:
+                logger.warning('Local change overlay fetch failed for %s; using EE tiles',
+                               idx, exc_info=True)
+
+        overlay = self._detector.build_change_overlay(first_image, last_image, idx, threshold)
+        m.addLayer(overlay, {'bands': ['vis-red', 'vis-green', 'vis-blue'], 'min': 0, 'max': 255},
+                   name, shown=False)
+
+    def _render_local_change_summary(self, first_image, last_image, idx, threshold) -> None:
+        """
+        Small AOIs: share of changed pixels and Δ spread, computed locally
+        from the same cached delta grid as the overlay, so moving the
+        threshold costs no EE call. Skipped for larger AOIs.
+        """
+        if self._config['buffer_km'] > ChangeDetector.LOCAL_MAX_BUFFER_KM:
+            return
+        try:
+            _, delta, _ = _change_arrays(
+                first_image, last_image, idx,
+                self._config['center_lat'], self._config['center_lon'],
+                self._config['buffer_km'],
+            )
+        except Exception:
+            logger.warning('Local change stats fetch failed for %s', idx, exc_info=True)
+            return
+        s = ChangeDetector.local_change_stats(delta, threshold)
+        if s['mean'] is None:
+            return
+        st.caption(
+            f"Pixels beyond ±{threshold}: **{s['decrease_pct']:.1f}%** decrease · "
+            f"**{s['increase_pct']:.1f}%** increase · "
+            f"Δ{idx} mean {s['mean']:+.4f} (σ {s['std']:.4f}, {s['min']:+.4f} … {s['max']:+.4f})"
+        )
 
     @staticmethod
     def _event_popup_html(ev, color, idx, first_date, last_date) -> str:
-        sev_label = SEVERITY_LABEL[ev['severity']]
-        delta_color = '#c0392b' if ev['delta'] < 0 else '#2d7a4f'
-        return f"""
-        <div style="font-family:Arial,sans-serif;min-width:200px;padding:4px;">
-            <div style="font-weight:700;font-size:13px;color:#{color};margin-bottom:4px;">
-                {sev_label} — {idx}
-            </div>
-            <table style="font-size:12px;width:100%;">
-                <tr><td style="color:#666;">Before ({first_date}):</td><td><b>{ev['value_before']:.4f}</b></td></tr>
-                <tr><td style="color:#666;">After ({last_date}):</td><td><b>{ev['value_after']:.4f}</b></td></tr>
-                <tr><td style="color:#666;">Change (Δ):</td>
-                    <td><b style="color:{delta_color}">{ev['delta']:+.4f}</b></td></tr>
-                <tr><td style="color:#666;">Location:</td><td>{ev['lat']:.5f}°N, {ev['lon']:.5f}°E</td></tr>
-            </table>
-        </div>
-        """
+        return _EVENT_POPUP_HTML.format(
+            color=color, sev_label=SEVERITY_LABEL[ev['severity']], idx=idx,
+            first_date=first_date, last_date=last_date, ev=ev,
+            delta_color='#c0392b' if ev['delta'] < 0 else '#2d7a4f',
+        )
 
     @staticmethod
     def _render_change_legend() -> None:
@@ -260,29 +428,28 @@ class ChangeTab:
         st.markdown('### Significant Change Events')
         st.caption(f'Detected changes in **{idx}** between {first_date} and {last_date}')
 
+        # One HTML table in a single markdown element, assembled as a list
+        # join, instead of eight st.columns cells per event.
         headers = ['#', 'Severity', 'Location', f'{idx} Before', f'{idx} After', 'Δ Change', 'Direction', 'Summary']
-        header_cols = st.columns([0.5, 1.5, 1.5, 1.2, 1.2, 1.2, 1.2, 2])
-        for col, h in zip(header_cols, headers):
-            col.markdown(f'**{h}**')
-        st.markdown('<hr style="margin:4px 0;border-color:#c5c5d8;">', unsafe_allow_html=True)
-
-        for i, ev in enumerate(events):
-            sev_color   = SEVERITY_COLOR[ev['severity']]
-            direction   = 'Decrease' if ev['delta'] < 0 else 'Increase'
-            delta_color = '#c0392b'  if ev['delta'] < 0 else '#2d7a4f'
-
-            cols = st.columns([0.5, 1.5, 1.5, 1.2, 1.2, 1.2, 1.2, 2])
-            cols[0].markdown(f"<span style='font-weight:700;color:#764ba2;'>{i+1}</span>", unsafe_allow_html=True)
-            cols[1].markdown(f"<span style='color:{sev_color};font-weight:600;'>{SEVERITY_LABEL[ev['severity']]}</span>", unsafe_allow_html=True)
-            cols[2].caption(f"{ev['lat']:.4f}°N\n{ev['lon']:.4f}°E")
-            cols[3].markdown(f'`{ev["value_before"]:.4f}`')
-            cols[4].markdown(f'`{ev["value_after"]:.4f}`')
-            cols[5].markdown(f"<span style='color:{delta_color};font-weight:700;'>{ev['delta']:+.4f}</span>", unsafe_allow_html=True)
-            cols[6].markdown(direction)
-            cols[7].caption(ev['label'])
-
-            if i < len(events) - 1:
-                st.markdown('<hr style="margin:2px 0;border-color:#f0f0f5;">', unsafe_allow_html=True)
+        parts = [
+            '<table style="width:100%;border-collapse:collapse;font-size:14px;">'
+            '<tr style="border-bottom:1px solid #c5c5d8;text-align:left;">',
+            *(f'<th style="padding:4px 6px;">{h}</th>' for h in headers),
+            '</tr>',
+        ]
+        row = _EVENT_ROW_HTML.format
+        parts.extend(
+            row(
+                n=n, ev=ev,
+                sev_color=SEVERITY_COLOR[ev['severity']],
+                sev_label=SEVERITY_LABEL[ev['severity']],
+                direction='Decrease' if ev['delta'] < 0 else 'Increase',
+                delta_color='#c0392b' if ev['delta'] < 0 else '#2d7a4f',
+            )
+            for n, ev in enumerate(events, start=1)
+        )
+        parts.append('</table>')
+        st.markdown(''.join(parts), unsafe_allow_html=True)
 
     # ── Stats comparison ─────────────────────────────────────────────────────
 
@@ -290,30 +457,27 @@ class ChangeTab:
                                  first_date, last_date) -> None:
         st.markdown('### Statistical Comparison')
 
-        before_stats = self._stats_calc.run(first_image, self._aoi, idx)
-        after_stats  = self._stats_calc.run(last_image,  self._aoi, idx)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown(f'#### Before — {first_date}')
-            st.metric('Median',  f"{before_stats.get(f'{idx}_median', 0):.4f}")
-            st.metric('Std Dev', f"{before_stats.get(f'{idx}_stdDev', 0):.4f}")
-            st.metric('Min',     f"{before_stats.get(f'{idx}_min',    0):.4f}")
-            st.metric('Max',     f"{before_stats.get(f'{idx}_max',    0):.4f}")
-
-        with c2:
-            st.markdown(f'#### After — {last_date}')
-            median_before = before_stats.get(f'{idx}_median', 0)
-            median_after  = after_stats.get(f'{idx}_median', 0)
-            st.metric('Median',  f"{median_after:.4f}", delta=f'{median_after - median_before:+.4f}')
-            st.metric('Std Dev', f"{after_stats.get(f'{idx}_stdDev', 0):.4f}")
-            st.metric('Min',     f"{after_stats.get(f'{idx}_min',    0):.4f}")
-            st.metric('Max',     f"{after_stats.get(f'{idx}_max',    0):.4f}")
+        before_stats, after_stats = _pair_stats(
+            first_image, last_image, self._aoi, idx, self._scale
+        )
 
-        st.markdown('### Comparative Trends')
         before_vals = [before_stats.get(f'{idx}_{k}', 0) for k in ('median', 'stdDev', 'min', 'max')]
         after_vals  = [after_stats.get(f'{idx}_{k}',  0) for k in ('median', 'stdDev', 'min', 'max')]
-        fig = self._charts.before_after_bars(before_vals, after_vals, idx)
+
+        # One table instead of eight st.metric widgets
+        table = pd.DataFrame(
+            {
+                f'Before — {first_date}': before_vals,
+                f'After — {last_date}':   after_vals,
+                'Δ': [a - b for a, b in zip(after_vals, before_vals)],
+            },
+            index=['Median', 'Std Dev', 'Min', 'Max'],
+        ).round(4)
+        st.dataframe(table, use_container_width=True)
+
+        st.markdown('### Comparative Trends')
+        from utils.visualization import ChartBuilder   # deferred: pulls in plotly
+        fig = ChartBuilder().before_after_bars(before_vals, after_vals, idx)
         st.plotly_chart(fig, use_container_width=True)
 
         return before_stats, after_stats
@@ -325,18 +489,22 @@ class ChangeTab:
         st.markdown('---')
         st.markdown('### AI Interpretation')
 
-        if before_stats is None:
-            before_stats = self._stats_calc.run(first_image, self._aoi, idx)
-        if after_stats is None:
-            after_stats  = self._stats_calc.run(last_image,  self._aoi, idx)
+        if before_stats is None or after_stats is None:
+            before_stats, after_stats = _pair_stats(
+                first_image, last_image, self._aoi, idx, self._scale
+            )
 
+        # Rounded so float noise between reruns still hits the cache
         with st.spinner('AI is analysing the satellite trends...'):
-            text = self._ai.interpret(
-                index_name=idx,
-                before_mean=before_stats.get(f'{idx}_median', 0),
-                after_mean=after_stats.get(f'{idx}_median',  0),
-                context=self._config['site_name'],
-            )
+            try:
+                text = _ai_interpretation(
+                    idx,
+                    round(before_stats.get(f'{idx}_median', 0), 4),
+                    round(after_stats.get(f'{idx}_median',  0), 4),
+                    self._config['site_name'],
+                )
+            except _AIUnavailable:
+                text = AIInterpreter.FALLBACK_MSG
         st.info(text)
         return text
 
@@ -348,7 +516,6 @@ class ChangeTab:
         """Persist the change-detection run to history DB (silent, best-effort)."""
         if not self._history_repo:
             return
-        from utils.hash_utils import HashUtils
         history_id = self._history_repo.get_id_by_hash(
             HashUtils.hash_config(self._config)
         )
@@ -373,18 +540,18 @@ class ChangeTab:
                 'ai_text':       ai_text or '',
             })
             st.session_state[snap_key] = True
+            bump_history_version()
         except Exception:
             pass  # never break the UI over a save failure
 
     # ── Helpers ──────────────────────────────────────────────────────────────
 
     def _get_vis_params(self, idx: str) -> dict:
-        custom_map = {c['name']: c for c in self._config.get('custom_indices', [])}
         if idx in INDICES_CONFIG:
             idc = INDICES_CONFIG[idx]
             return {'min': idc['min'], 'max': idc['max'], 'palette': idc['palette']}
-        if idx in custom_map:
-            ci = custom_map[idx]
+        if idx in self._custom_map:
+            ci = self._custom_map[idx]
             return {'min': ci.get('min', -1), 'max': ci.get('max', 1),
                     'palette': ci.get('palette', ['FF0000', 'FFFFFF', '00AA00'])}
         return {'min': -1, 'max': 1, 'palette': ['FF0000', 'FFFFFF', '00AA00']}
\ No newline at end of file
@@ -23,7 +23,10 @@ from backend.db.db_connection import DBConnection
 from backend.gee.collection_builder import CollectionBuilder
 from backend.gee.index_calculator import IndexCalculator
 from config.indices_config import INDICES_CONFIG
+from config.theme import HISTORY_CARD_CSS
 from backend.gee.change_detector import SEVERITY_COLOR, SEVERITY_LABEL
+from utils.palette_utils import PaletteUtils
+from utils.streamlit_utils import bump_history_version, fragment, history_version
 
 try:
     from streamlit_folium import st_folium
@@ -48,6 +51,12 @@ _DELTA_BORDER = {
 }
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_sessions(_repo: HistoryRepository, limit: int, version: int) -> list[dict]:
+    """Cached session list; `version` is the process-wide history write counter."""
+    return _repo.list_sessions(limit=limit)
+
+
 class HistoryTab:
     """
     Usage:
@@ -63,10 +72,13 @@ class HistoryTab:
 
     # ── entry point ───────────────────────────────────────────────────────────
 
+    @fragment
     def render(self) -> None:
         st.subheader('Analysis History')
 
-        sessions = self._repo.list_sessions(limit=60)
+        sessions = _list_sessions(
+            self._repo, 60, history_version()
+        )
         if not sessions:
             st.info('No analysis sessions saved yet. Run an analysis first.')
             return
@@ -75,41 +87,7 @@ class HistoryTab:
             st.session_state.history_selected_id = None
 
         # CSS: make st.button look like a styled info card (no split screen)
-        st.markdown("""
-        <style>
-        [data-testid="stHorizontalBlock"] { gap: 0 !important; }
-        div[data-testid="column"] > div > div > div > button {
-            background: transparent !important;
-            border: none !important;
-            padding: 0 !important;
-            height: auto !important;
-        }
-        .hist-card {
-            border: 1.5px solid #e0d6f0;
-            border-radius: 10px;
-            padding: 12px 14px;
-            margin-bottom: 6px;
-            background: #faf7fd;
-            cursor: pointer;
-            transition: border-color 0.15s;
-        }
-        .hist-card:hover { border-color: #764ba2; }
-        .hist-card.active {
-            background: linear-gradient(135deg,#4a2d6b,#764ba2);
-            border-color: #764ba2;
-        }
-        .hist-card .title  { font-weight:700; font-size:14px; color:#2c2c3e; }
-        .hist-card.active .title,
-        .hist-card.active .sub,
-        .hist-card.active .tiny { color: white !important; opacity: 1 !important; }
-        .hist-card .sub    { font-size:11px; color:#6b6b8a; margin-top:3px; }
-        .hist-card .tiny   { font-size:10px; color:#6b6b8a; margin-top:2px; opacity:0.8; }
-        .badge-y { background:#f0c040; color:#2c2c3e; font-size:10px; font-weight:700;
-                   padding:1px 7px; border-radius:10px; margin-left:6px; }
-        .badge-p { background:#9b6fc5; color:white; font-size:10px; font-weight:700;
-                   padding:1px 7px; border-radius:10px; margin-left:4px; }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(HISTORY_CARD_CSS, unsafe_allow_html=True)
 
         search = st.text_input(' Filter by site', key='history_search',
                                placeholder='e.g. Alba Iulia').strip().lower()
@@ -305,7 +283,7 @@ class HistoryTab:
             )
             m.addLayer(aoi_style, {}, 'AOI')
             m.add_layer_control()
-            m.centerObject(aoi, 14)
+            m.set_center(cached['lon'], cached['lat'], 14)
 
             if _HAS_ST_FOLIUM:
                 st_folium(m, height=480, width='100%',
@@ -342,8 +320,7 @@ class HistoryTab:
 
             # Colour bar
             palette   = idc.get('palette', [])
-            hex_pal   = ['#'+p if not p.startswith('#') else p for p in palette]
-            grad      = ', '.join(hex_pal) if hex_pal else '#ccc, #ccc'
+            grad      = PaletteUtils.gradient_css(palette) if palette else '#ccc, #ccc'
             vmin, vmax = idc.get('min', 0), idc.get('max', 1)
 
             with st.expander(f'**{idx}** — {name}', expanded=True):
@@ -482,6 +459,7 @@ class HistoryTab:
                          type='primary', use_container_width=True):
                 if note_text.strip():
                     self._repo.add_note(history_id, note_text.strip())
+                    bump_history_version()
                     st.success('Note saved.')
                     st.rerun()
                 else:
@@ -514,4 +492,5 @@ class HistoryTab:
                 if st.button('🗑', key=f'del_note_{note["id"]}',
                              help='Delete this note'):
                     self._repo.delete_note(note['id'])
+                    bump_history_version()
                     st.rerun()
\ No newline at end of file
@@ -10,6 +10,7 @@ import ee
 from datetime import datetime
 import geemap.foliumap as geemap
 import numpy as np
+from utils.streamlit_utils import fragment
 
 try:
     from streamlit_folium import st_folium
@@ -40,6 +41,7 @@ VIS_PARAMS = {
 }
 
 
+@fragment
 def render_land_cover_tab(results):
     """
     Land Cover Classification using geemap's optimized Dynamic World functions
@@ -119,12 +121,7 @@ def render_land_cover_tab(results):
         )
 
         # Add AOI boundary
-        aoi_style = ee.FeatureCollection(aoi).style(
-            color='764ba2',
-            fillColor='764ba200',
-            width=2
-        )
-        Map.addLayer(aoi_style, {}, 'Area of Interest')
+        Map.addLayer(results['aoi_style'], {}, 'Area of Interest')
 
         # Add legend
         Map.add_legend(
@@ -133,7 +130,7 @@ def render_land_cover_tab(results):
             colors=['#' + DW_CLASSES[i]['hex'] for i in range(9)]
         )
 
-        Map.centerObject(aoi, 14)
+        Map.set_center(config['center_lon'], config['center_lat'], 14)
         Map.add_layer_control()
 
         if st_folium:
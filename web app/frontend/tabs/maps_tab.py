@@ -9,12 +9,14 @@ from datetime import datetime
 
 from config.indices_config import INDICES_CONFIG
 from config.settings import GEE_MAX_PIXELS
+from config.theme import MAPS_MODE_BUTTON_CSS
 from frontend.components.map_widget import MapWidget
 from frontend.components.legend_widget import LegendWidget
 from backend.gee.index_calculator import IndexCalculator
 from backend.gee.gif_generator import GifGenerator
 from backend.gee.statistics_calculator import StatisticsCalculator
 from utils.date_utils import DateUtils
+from utils.streamlit_utils import fragment
 
 try:
     from streamlit_folium import st_folium
@@ -42,11 +44,14 @@ class MapsTab:
         self._collection = results['collection']
         self._aoi        = results['aoi']
         self._count      = results['count']
+        self._custom_map = results.get('custom_index_map', {})
         self._calc       = IndexCalculator()
         self._stats_calc = StatisticsCalculator()
+        self._scale      = StatisticsCalculator.scale_for(self._config['buffer_km'])
         self._gif_gen    = GifGenerator()
         self._widget     = MapWidget(self._config['center_lat'], self._config['center_lon'])
 
+    @fragment
     def render(self) -> None:
         st.subheader(f"Interactive Maps — {self._config['site_name']}")
 
@@ -66,7 +71,7 @@ class MapsTab:
             self._render_timelapse(selected_view)
 
         if view_mode != 'Timelapse GIF':
-            LegendWidget(self._config).render()
+            LegendWidget(self._config, self._custom_map).render()
 
     # ── Layer selector ───────────────────────────────────────────────────────
 
@@ -74,7 +79,7 @@ class MapsTab:
         available = ['Natural Color (RGB)'] + [
             i for i in self._config['indices']
             if i in INDICES_CONFIG or
-            i in {c['name'] for c in self._config.get('custom_indices', [])}
+            i in self._custom_map
         ]
         col_layer, col_meta = st.columns([4, 1])
         with col_layer:
@@ -89,19 +94,7 @@ class MapsTab:
         if 'maps_view_mode' not in st.session_state:
             st.session_state.maps_view_mode = 'Median'
 
-        st.markdown("""
-        <style>
-        div[data-testid="stHorizontalBlock"] button[kind="secondary"] {
-            position: relative !important;
-            opacity: 0 !important;
-            height: 50px !important;
-            margin-top: -54px !important;
-            width: 100% !important;
-            cursor: pointer !important;
-            z-index: 10 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(MAPS_MODE_BUTTON_CSS, unsafe_allow_html=True)
 
         btn_cols = st.columns(len(self.VIEW_MODES))
         for col, key in zip(btn_cols, self.VIEW_MODES):
@@ -143,7 +136,7 @@ class MapsTab:
 
         self._widget.add_aoi_border(m, self._aoi)
         self._widget.add_draw_control(m)
-        m.centerObject(self._aoi, 14)
+        m.set_center(self._config['center_lon'], self._config['center_lat'], 14)
         out = self._widget.render(m)
         if out and 'all_drawings' in out:
             st.session_state.latest_drawings = out['all_drawings']
@@ -206,28 +199,28 @@ class MapsTab:
 
         self._widget.add_aoi_border(m, self._aoi)
         self._widget.add_date_overlay(m, cur_date_str, st.session_state.browse_idx + 1, total)
-        m.centerObject(self._aoi, 14)
+        m.set_center(self._config['center_lon'], self._config['center_lat'], 14)
         self._widget.render(m, key=f'browse_{st.session_state.browse_idx}_{selected_view}')
 
-        # Per-date stats below the map
+        # Per-date stats below the map, from the index image already built
         if selected_view != 'Natural Color (RGB)':
-            img_idx2 = self._calc.compute(image, extra_indices=extra)
-            self._render_browse_stats(img_idx2, cur_date_str)
+            self._render_browse_stats(img_idx, cur_date_str)
 
     def _render_browse_stats(self, image: ee.Image, date_str: str) -> None:
         indices = [
             i for i in self._config['indices']
             if i in INDICES_CONFIG or
-            i in {c['name'] for c in self._config.get('custom_indices', [])}
+            i in self._custom_map
         ]
         if not indices:
             return
         st.markdown(f'**Index values — {date_str}**')
+        # One fused reduceRegion for every index instead of one per metric card
+        all_stats = self._stats_calc.run_multiple(image, self._aoi, indices, self._scale)
         cols = st.columns(min(len(indices), 5))
         for i, idx in enumerate(indices):
             with cols[i % len(cols)]:
-                stats = self._stats_calc.run(image, self._aoi, idx)
-                val   = stats.get(f'{idx}_median')
+                val = all_stats.get(idx, {}).get(f'{idx}_median')
                 st.metric(idx, f'{val:.4f}' if val is not None else 'N/A')
 
     # ── Timelapse GIF ────────────────────────────────────────────────────────
@@ -301,7 +294,6 @@ class MapsTab:
     def _add_index_layer(
         self, m, image: ee.Image, idx: str, visible: bool = True
     ) -> None:
-        custom_map = {c['name']: c for c in self._config.get('custom_indices', [])}
         if idx in INDICES_CONFIG:
             idc = INDICES_CONFIG[idx]
             self._widget.add_ee_layer(
@@ -309,8 +301,8 @@ class MapsTab:
                 {'min': idc['min'], 'max': idc['max'], 'palette': idc['palette']},
                 idx, visible,
             )
-        elif idx in custom_map:
-            ci = custom_map[idx]
+        elif idx in self._custom_map:
+            ci = self._custom_map[idx]
             self._widget.add_ee_layer(
                 m, image.select(idx),
                 {'min': ci.get('min', -1), 'max': ci.get('max', 1),
@@ -321,12 +313,11 @@ class MapsTab:
     def _get_vis_params(self, selected_view: str) -> dict:
         if selected_view == 'Natural Color (RGB)':
             return {}
-        custom_map = {c['name']: c for c in self._config.get('custom_indices', [])}
         if selected_view in INDICES_CONFIG:
             idc = INDICES_CONFIG[selected_view]
             return {'min': idc['min'], 'max': idc['max'], 'palette': idc['palette']}
-        if selected_view in custom_map:
-            ci = custom_map[selected_view]
+        if selected_view in self._custom_map:
+            ci = self._custom_map[selected_view]
             return {'min': ci.get('min', -1), 'max': ci.get('max', 1),
                     'palette': ci.get('palette', ['FFFFFF', '0000FF'])}
         return {}
\ No newline at end of file
@@ -10,6 +10,106 @@ from backend.gee.statistics_calculator import StatisticsCalculator
 from backend.export.report_builder import ReportBuilder
 from frontend.components.metric_cards import MetricCards
 from config.indices_config import INDICES_CONFIG
+from utils.streamlit_utils import fragment
+
+
+# Rule-based interpretation per index: (upper bound, st level, message),
+# checked in order; None is the catch-all. Built once at import.
+_INTERPRETATION_RULES = {
+    'NDVI': [
+        (0.2,  'warning', 'Low vegetation cover. May indicate bare soil, urban areas, or stress.'),
+        (0.4,  'info',    'Moderate vegetation cover. Mix of vegetated and non-vegetated areas.'),
+        (None, 'success', 'Healthy vegetation cover detected.'),
+    ],
+    'NDBI': [
+        (0.3,  'warning', 'Significant built-up area. Monitor urban encroachment.'),
+        (0.0,  'info',    'Some built-up structures present.'),
+        (None, 'success', 'Predominantly natural landscape.'),
+    ],
+    'NDMI': [
+        (-0.2, 'warning', 'Low moisture content. Increased erosion risk.'),
+        (0.2,  'info',    'Moderate moisture levels. Normal conditions.'),
+        (None, 'success', 'High moisture content.'),
+    ],
+    'NDWI': [
+        (0.3,  'info', 'Significant water presence detected. Monitor for flooding risk.'),
+        (0.0,  'info', 'Some water bodies present.'),
+        (None, 'success', 'No significant water accumulation.'),
+    ],
+    'BSI': [
+        (0.3,  'warning', 'High bare soil exposure. Increased erosion vulnerability.'),
+        (0.0,  'info',    'Moderate soil exposure present.'),
+        (None, 'success', 'Minimal bare soil.'),
+    ],
+}
+
+
+# Static report sections: one pre-built string per column, formatted or
+# passed through as-is, instead of re-dedenting literals on every rerun.
+_QUALITY_STRENGTHS_HTML = (
+    "<div style='background:#e8f5e9;padding:15px;border-radius:8px;border-left:4px solid #4caf50;'>"
+    "<h4 style='color:#2e7d32;margin-top:0;'>Data Strengths</h4></div>"
+    "<ul>"
+    "<li><strong>Image Count:</strong> {count} scenes — {coverage} temporal coverage</li>"
+    "<li><strong>Resolution:</strong> 10-metre spatial resolution</li>"
+    "<li><strong>Multi-spectral:</strong> 13 bands from visible to SWIR</li>"
+    "<li><strong>Cloud Filtering:</strong> ≤ {cloud_cover}% cloud cover</li>"
+    "<li><strong>Revisit Time:</strong> 5-day satellite cycle</li>"
+    "</ul>"
+)
+
+_QUALITY_LIMITATIONS_HTML = (
+    "<div style='background:#fff3e0;padding:15px;border-radius:8px;border-left:4px solid #ff9800;'>"
+    "<h4 style='color:#e65100;margin-top:0;'>Limitations</h4></div>"
+    "<ul>"
+    "<li>Residual clouds may affect local quality</li>"
+    "<li>Weather conditions may create temporal gaps</li>"
+    "<li>10m resolution may miss fine architectural details</li>"
+    "<li>Surface-only observations (no subsurface)</li>"
+    "<li>Ground-truth validation recommended</li>"
+    "</ul>"
+)
+
+_METHODOLOGY_SOURCES_MD = """\
+#### Data Sources
+**Sentinel-2 Mission:**
+- ESA Earth observation program
+- Twin satellites (2A & 2B), launched 2015/2017
+- 13 spectral bands, 290 km swath
+- 5-day global revisit cycle
+
+**Processing Platform:**
+- Google Earth Engine cloud computing
+- Petabyte-scale imagery archive
+"""
+
+_METHODOLOGY_FORMULAS_MD = """\
+#### Spectral Indices Formulas
+```
+NDVI = (B8 - B4) / (B8 + B4)
+NDBI = (B11 - B8) / (B11 + B8)
+NDMI = (B8 - B11) / (B8 + B11)
+NDWI = (B3 - B8) / (B3 + B8)
+BSI  = ((B11+B4)-(B8+B2)) / ((B11+B4)+(B8+B2))
+```
+"""
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _report_bodies(config: dict, indices_stats: dict, count: int) -> tuple[str, bytes, bytes, bytes]:
+    """
+    (filename base, JSON, text, CSV) for one analysis. Pure function of its
+    inputs, so unrelated reruns reuse the built bodies; the generation
+    timestamp is the time of the first build. Bodies are cached as UTF-8
+    bytes, so st.download_button does not re-encode them on every rerun.
+    """
+    builder = ReportBuilder(config, indices_stats, count)
+    return (
+        builder.filename_base(),
+        builder.as_json().encode('utf-8'),
+        builder.as_text().encode('utf-8'),
+        builder.as_csv(),
+    )
 
 
 class ReportTab:
@@ -32,10 +132,13 @@ class ReportTab:
         self._collection = results['collection']
         self._aoi        = results['aoi']
         self._count      = results['count']
+        self._stats      = results.get('stats') or {}
         self._calc       = IndexCalculator()
         self._stats_calc = StatisticsCalculator()
+        self._scale      = StatisticsCalculator.scale_for(self._config['buffer_km'])
         self._cards      = MetricCards()
 
+    @fragment
     def render(self) -> None:
         st.subheader('Comprehensive Monitoring Report')
 
@@ -82,7 +185,7 @@ class ReportTab:
             - **Latitude:** {cfg['center_lat']:.6f}°
             - **Longitude:** {cfg['center_lon']:.6f}°
             - **Radius:** {cfg['buffer_km']} km
-            - **Area:** ~{3.14159 * cfg['buffer_km']**2:.2f} km²
+            - **Area:** ~{ReportBuilder.area_km2(cfg['buffer_km']):.2f} km²
             """)
             st.markdown('</div>', unsafe_allow_html=True)
 
@@ -114,34 +217,7 @@ class ReportTab:
 
     def _interpret(self, idx: str, median_val: float) -> None:
         """Simple rule-based interpretation (no AI — AI is in ChangeTab)."""
-        rules = {
-            'NDVI': [
-                (0.2,  'warning', 'Low vegetation cover. May indicate bare soil, urban areas, or stress.'),
-                (0.4,  'info',    'Moderate vegetation cover. Mix of vegetated and non-vegetated areas.'),
-                (None, 'success', 'Healthy vegetation cover detected.'),
-            ],
-            'NDBI': [
-                (0.3,  'warning', 'Significant built-up area. Monitor urban encroachment.'),
-                (0.0,  'info',    'Some built-up structures present.'),
-                (None, 'success', 'Predominantly natural landscape.'),
-            ],
-            'NDMI': [
-                (-0.2, 'warning', 'Low moisture content. Increased erosion risk.'),
-                (0.2,  'info',    'Moderate moisture levels. Normal conditions.'),
-                (None, 'success', 'High moisture content.'),
-            ],
-            'NDWI': [
-                (0.3,  'info', 'Significant water presence detected. Monitor for flooding risk.'),
-                (0.0,  'info', 'Some water bodies present.'),
-                (None, 'success', 'No significant water accumulation.'),
-            ],
-            'BSI': [
-                (0.3,  'warning', 'High bare soil exposure. Increased erosion vulnerability.'),
-                (0.0,  'info',    'Moderate soil exposure present.'),
-                (None, 'success', 'Minimal bare soil.'),
-            ],
-        }
-        for threshold, level, message in rules.get(idx, []):
+        for threshold, level, message in _INTERPRETATION_RULES.get(idx, []):
             if threshold is None or median_val < threshold:
                 getattr(st, level)(message)
                 return
@@ -153,78 +229,40 @@ class ReportTab:
         coverage = 'excellent' if self._count >= 20 else 'good' if self._count >= 10 else 'adequate'
 
         with col1:
-            st.markdown(f"""
-            <div style='background:#e8f5e9;padding:15px;border-radius:8px;border-left:4px solid #4caf50;'>
-                <h4 style='color:#2e7d32;margin-top:0;'>Data Strengths</h4>
-            </div>""", unsafe_allow_html=True)
-            st.markdown(f"""
-            - **Image Count:** {self._count} scenes — {coverage} temporal coverage
-            - **Resolution:** 10-metre spatial resolution
-            - **Multi-spectral:** 13 bands from visible to SWIR
-            - **Cloud Filtering:** ≤ {self._config['cloud_cover']}% cloud cover
-            - **Revisit Time:** 5-day satellite cycle
-            """)
-
+            st.markdown(_QUALITY_STRENGTHS_HTML.format(
+                count=self._count, coverage=coverage, cloud_cover=self._config['cloud_cover'],
+            ), unsafe_allow_html=True)
         with col2:
-            st.markdown("""
-            <div style='background:#fff3e0;padding:15px;border-radius:8px;border-left:4px solid #ff9800;'>
-                <h4 style='color:#e65100;margin-top:0;'>Limitations</h4>
-            </div>""", unsafe_allow_html=True)
-            st.markdown("""
-            - Residual clouds may affect local quality
-            - Weather conditions may create temporal gaps
-            - 10m resolution may miss fine architectural details
-            - Surface-only observations (no subsurface)
-            - Ground-truth validation recommended
-            """)
+            st.markdown(_QUALITY_LIMITATIONS_HTML, unsafe_allow_html=True)
 
     def _render_methodology(self) -> None:
         with st.expander('Methodology & Scientific Background', expanded=False):
             col1, col2 = st.columns(2)
             with col1:
-                st.markdown("""
-                #### Data Sources
-                **Sentinel-2 Mission:**
-                - ESA Earth observation program
-                - Twin satellites (2A & 2B), launched 2015/2017
-                - 13 spectral bands, 290 km swath
-                - 5-day global revisit cycle
-
-                **Processing Platform:**
-                - Google Earth Engine cloud computing
-                - Petabyte-scale imagery archive
-                """)
+                st.markdown(_METHODOLOGY_SOURCES_MD)
             with col2:
-                st.markdown("""
-                #### Spectral Indices Formulas
-                ```
-                NDVI = (B8 - B4) / (B8 + B4)
-                NDBI = (B11 - B8) / (B11 + B8)
-                NDMI = (B8 - B11) / (B8 + B11)
-                NDWI = (B3 - B8) / (B3 + B8)
-                BSI  = ((B11+B4)-(B8+B2)) / ((B11+B4)+(B8+B2))
-                ```
-                """)
+                st.markdown(_METHODOLOGY_FORMULAS_MD)
 
     def _render_downloads(self, indices_stats: dict) -> None:
         st.markdown('### Export Report & Data')
 
-        builder = ReportBuilder(self._config, indices_stats, self._count)
-        base    = builder.filename_base()
+        base, json_body, text_body, csv_body = _report_bodies(
+            self._config, indices_stats, self._count
+        )
 
         col1, col2, col3 = st.columns(3)
 
         with col1:
             st.download_button(
                 'Download JSON Report',
-                data=builder.as_json(),
+                data=json_body,
                 file_name=f'{base}.json',
                 mime='application/json',
             )
         with col2:
             st.download_button(
                 'Download Text Report',
-                data=builder.as_text(),
+                data=text_body,
                 file_name=f'{base}.txt',
                 mime='text/plain',
             )
@@ -232,7 +270,7 @@ class ReportTab:
             if indices_stats:
                 st.download_button(
                     'Download Statistics CSV',
-                    data=builder.as_csv(),
+                    data=csv_body,
                     file_name=f'{base}.csv',
                     mime='text/csv',
                 )
@@ -240,9 +278,20 @@ class ReportTab:
     # ── Private helpers ──────────────────────────────────────────────────────
 
     def _compute_all_stats(self) -> dict:
+        """
+        Reuse the per-index stats already computed by the analysis run (same
+        median composite and scale) and reduce only the indices it lacks,
+        all in one fused reduceRegion.
+        """
         if self._count == 0:
             return {}
+        indices = self._config['indices']
+        missing = [idx for idx in indices if not self._stats.get(idx)]
+        if not missing:
+            return {idx: self._stats[idx] for idx in indices}
+
         extra        = self._config.get('custom_indices', [])
         median_image = self._collection.median()
         indexed      = self._calc.compute(median_image, extra_indices=extra)
-        return self._stats_calc.run_multiple(indexed, self._aoi, self._config['indices'])
\ No newline at end of file
+        computed     = self._stats_calc.run_multiple(indexed, self._aoi, missing, self._scale)
+        return {idx: self._stats.get(idx) or computed.get(idx, {}) for idx in indices}
\ No newline at end of file
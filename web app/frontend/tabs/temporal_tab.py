@@ -2,16 +2,42 @@
 Responsible for: rendering the Temporal Analysis tab.
 """
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import ee
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
+from backend.gee.collection_builder import CollectionBuilder
 from backend.gee.index_calculator import IndexCalculator
 from backend.gee.statistics_calculator import StatisticsCalculator
 from backend.db.db_connection import DBConnection
 from backend.db.temporal_repository import TemporalRepository
 from utils.date_utils import DateUtils
+from utils.hash_utils import HashUtils
+from utils.single_flight import SingleFlight
 from utils.visualization import ChartBuilder
+from utils.streamlit_utils import EE_HASH_FUNCS, fragment, polling_fragment
+
+
+@st.cache_data(ttl=3600, show_spinner=False, hash_funcs=EE_HASH_FUNCS)
+def _collection_timestamps(collection: ee.ImageCollection) -> list[int]:
+    return CollectionBuilder().get_timestamps(collection)
+
+
+@st.cache_resource
+def _backfill_flights() -> SingleFlight:
+    """Gap-fill workers shared across sessions; one job per analysis."""
+    return SingleFlight(ThreadPoolExecutor(max_workers=2, thread_name_prefix='gee-backfill'))
+
+
+@polling_fragment(run_every=1.0)
+def _backfill_progress(future) -> None:
+    """Progress notice; only this fragment reruns until the gap-fill ends."""
+    if future.done():
+        st.rerun()   # full run replots every index from the DB
+    st.info('Fetching missing dates from the satellite archive — charts refresh when it finishes.')
 
 
 class TemporalTab:
@@ -19,77 +45,95 @@ class TemporalTab:
     Renders incremental temporal analysis:
     1. Reads already-cached data points from MySQL.
     2. Identifies GEE timestamps not yet in the DB.
-    3. Processes only the gaps.
-    4. Reloads the full range and plots it.
+    3. Processes only the gaps in a background worker.
+    4. Plots whatever the DB holds, and replots once the gap-fill is done.
 
     Usage:
         tab = TemporalTab(results, db)
         tab.render()
     """
 
+    BACKFILL_BATCH = 50   # images per server-side statistics sweep
+    BACKFILL_JOBS_KEY = 'temporal_backfill_jobs'
+
     def __init__(self, results: dict, db: DBConnection):
         self._config     = results['config']
         self._collection = results['collection']
         self._aoi        = results['aoi']
         self._calc       = IndexCalculator()
         self._stats_calc = StatisticsCalculator()
+        self._scale      = StatisticsCalculator.scale_for(self._config['buffer_km'])
         self._repo       = TemporalRepository(db)
         self._charts     = ChartBuilder()
 
+    @fragment
     def render(self) -> None:
         st.subheader('Incremental Temporal Analysis')
 
+        self._start_backfill()
+
         for idx_name in self._config['indices']:
             st.write(f'### {idx_name} Evolution')
             self._render_index(idx_name)
 
+    def _start_backfill(self) -> None:
+        """
+        Submit the gap-fill for this analysis once per session and report
+        on it. The job runs off the script thread, so the charts render
+        straight away from the points already cached. A failed job is
+        dropped after its warning, so the next render resubmits it.
+        """
+        key = json.dumps(
+            [HashUtils.hash_config(self._config), self._config['indices'],
+             self._config.get('custom_indices', [])],
+            sort_keys=True, default=str,
+        )
+        jobs   = st.session_state.setdefault(self.BACKFILL_JOBS_KEY, {})
+        future = jobs.get(key)
+
+        if future is None:
+            # Gaps for every index are filled together: one sweep per batch
+            # reduces all index bands instead of one sweep per index.
+            missing = self._find_missing()
+            if not any(missing.values()):
+                return
+            future = jobs[key] = _backfill_flights().submit(
+                key, self._backfill, self._config['site_name'], missing
+            )
+
+        if not future.done():
+            _backfill_progress(future)
+        elif future.exception() is not None:
+            del jobs[key]
+            st.warning(f'Temporal back-fill failed: {future.exception()}')
+
     # ── Per-index rendering ──────────────────────────────────────────────────
 
-    def _render_index(self, idx_name: str) -> None:
+    def _find_missing(self) -> dict[str, list[int]]:
+        """Map each index to the GEE timestamps whose date is not yet in the DB."""
         site       = self._config['site_name']
         start_date = self._config['start_date']
         end_date   = self._config['end_date']
 
-        # 1. Existing dates in DB
-        existing_dates = self._repo.get_existing_dates(site, idx_name, start_date, end_date)
-
-        # 2. All timestamps in GEE collection
-        all_timestamps = self._collection.aggregate_array('system:time_start').getInfo()
-
-        # 3. Only process dates missing from DB
-        missing = [
-            ts for ts in all_timestamps
-            if DateUtils.from_timestamp_ms(ts).strftime('%Y-%m-%d') not in existing_dates
-        ]
-
-        if missing:
-            bar = st.progress(0)
-            extra = self._config.get('custom_indices', [])
-
-            for i, ts in enumerate(missing):
-                curr_dt  = DateUtils.from_timestamp_ms(ts)
-                date_str = curr_dt.strftime('%Y-%m-%d')
-                next_str = DateUtils.day_after(curr_dt)
-
-                img = ee.Image(
-                    self._collection.filterDate(date_str, next_str).first()
-                )
-                img_with_idx = self._calc.compute(img, extra_indices=extra)
-                stats        = self._stats_calc.run(img_with_idx, self._aoi, idx_name)
-                val          = stats.get(f'{idx_name}_median')
+        all_timestamps = _collection_timestamps(self._collection)
+        ts_dates = dict(zip(all_timestamps, DateUtils.timestamps_to_iso(all_timestamps)))
 
-                if val is not None:
-                    self._repo.save_point(site, idx_name, curr_dt.date(), val)
+        missing = {}
+        for idx_name in self._config['indices']:
+            existing_dates    = self._repo.get_existing_dates(site, idx_name, start_date, end_date)
+            missing[idx_name] = [ts for ts, d in ts_dates.items() if d not in existing_dates]
+        return missing
 
-                bar.progress((i + 1) / len(missing))
-            bar.empty()
+    def _render_index(self, idx_name: str) -> None:
+        site       = self._config['site_name']
+        start_date = self._config['start_date']
+        end_date   = self._config['end_date']
 
-        # 4. Reload full range from DB and plot
         df = self._repo.find_range(site, idx_name, start_date, end_date)
 
         if not df.empty:
             chart_data = {
-                idx_name: dict(zip(df['analysis_date'].astype(str), df['value']))
+                idx_name: dict(zip(df['analysis_date'].dt.strftime('%Y-%m-%d'), df['value']))
             }
             fig = self._charts.time_series(
                 chart_data,
@@ -98,4 +142,41 @@ class TemporalTab:
             )
             st.plotly_chart(fig, use_container_width=True)
         else:
-            st.warning(f'No temporal data available for {idx_name}.')
\ No newline at end of file
+            st.warning(f'No temporal data available for {idx_name}.')
+
+    # ── Gap processing ───────────────────────────────────────────────────────
+
+    def _backfill(self, site: str, missing: dict[str, list[int]]) -> None:
+        """
+        Compute and store every index for its *missing* timestamps.
+        Each batch is one server-side map over the matching images that
+        reduces all gap indices at once, rather than one sweep per index.
+        Runs on a worker thread, so it must not call into Streamlit.
+        """
+        extra   = self._config.get('custom_indices', [])
+        indices = [idx for idx, ts in missing.items() if ts]
+        wanted  = {idx: set(missing[idx]) for idx in indices}
+        pending = sorted(set().union(*wanted.values()))
+        saved   = set()
+
+        for start in range(0, len(pending), self.BACKFILL_BATCH):
+            batch   = pending[start:start + self.BACKFILL_BATCH]
+            images  = self._collection.filter(
+                ee.Filter.inList('system:time_start', batch)
+            )
+            indexed = images.map(lambda img: self._calc.compute(img, extra_indices=extra))
+            series  = self._stats_calc.run_series(indexed, self._aoi, indices, self._scale)
+
+            rows = []
+            batch_ts = sorted(series)
+            for ts, iso in zip(batch_ts, DateUtils.timestamps_to_iso(batch_ts)):
+                curr_date = date.fromisoformat(iso)
+                for idx_name in indices:
+                    val = series[ts].get(f'{idx_name}_median')
+                    # Several granules can share a date; keep the first one
+                    if (val is not None and ts in wanted[idx_name]
+                            and (idx_name, curr_date) not in saved):
+                        rows.append((idx_name, curr_date, val))
+                        saved.add((idx_name, curr_date))
+            # One bulk insert per batch, so finished batches survive a failure
+            self._repo.save_points(site, rows)
@@ -0,0 +1,67 @@
+"""
+The local change overlay must reach the browser with the colours
+blend_change_arrays computed, not folium's per-channel stretch.
+"""
+
+import base64
+import struct
+import zlib
+
+import folium
+import numpy as np
+
+from backend.gee.change_detector import ChangeDetector
+
+BOUNDS = [[46.0, 23.5], [46.1, 23.6]]
+
+
+def _overlay_pixels(image: np.ndarray) -> np.ndarray:
+    """Decode the RGBA PNG embedded in an ImageOverlay's data URL."""
+    url = folium.raster_layers.ImageOverlay(image=image, bounds=BOUNDS).url
+    png = base64.b64decode(url.split(',', 1)[1])
+
+    pos, idat, width, height = 8, b'', 0, 0
+    while pos < len(png):
+        length, kind = struct.unpack('>I4s', png[pos:pos + 8])
+        body = png[pos + 8:pos + 8 + length]
+        if kind == b'IHDR':
+            width, height = struct.unpack('>II', body[:8])
+        elif kind == b'IDAT':
+            idat += body
+        pos += 12 + length
+
+    # folium writes unfiltered scanlines: one 0 filter byte, then RGBA bytes
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, 1 + 4 * width)
+    assert (rows[:, 0] == 0).all()
+    return rows[:, 1:].reshape(height, width, 4)
+
+
+def test_unchanged_pixels_keep_their_colour():
+    rgb   = np.full((4, 5, 3), [100, 50, 20], dtype=np.float32)
+    delta = np.zeros((4, 5), dtype=np.float32)
+
+    pixels = _overlay_pixels(ChangeDetector.blend_change_arrays(rgb, delta, 0.2))
+
+    assert (pixels == [100, 50, 20, 255]).all()
+
+
+def test_changed_pixels_are_tinted_not_stretched():
+    rgb   = np.full((2, 2, 3), [100, 50, 20], dtype=np.float32)
+    delta = np.array([[-0.5, 0.0], [0.0, 0.5]], dtype=np.float32)
+
+    blended = ChangeDetector.blend_change_arrays(rgb, delta, 0.2)
+    pixels  = _overlay_pixels(blended)
+
+    assert (pixels == blended).all()
+    assert pixels[0, 0, 0] > 200 and pixels[1, 1, 2] > 140   # red / blue tint
+    assert pixels[0, 1].tolist() == [100, 50, 20, 255]
+
+
+def test_masked_pixels_are_transparent():
+    rgb   = np.full((1, 2, 3), [100, 50, 20], dtype=np.float32)
+    delta = np.array([[np.nan, 0.0]], dtype=np.float32)
+
+    pixels = _overlay_pixels(ChangeDetector.blend_change_arrays(rgb, delta, 0.2))
+
+    assert pixels[0, 0, 3] == 0
+    assert pixels[0, 1].tolist() == [100, 50, 20, 255]
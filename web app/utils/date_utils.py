@@ -4,6 +4,8 @@ Responsible for: date parsing, formatting and range operations.
 
 from datetime import datetime, timedelta, date
 
+import numpy as np
+
 
 class DateUtils:
     """
@@ -33,6 +35,17 @@ class DateUtils:
         """Convert a Unix millisecond timestamp to a naive datetime."""
         return datetime.fromtimestamp(ts_ms / 1000)
 
+    @staticmethod
+    def timestamps_to_iso(timestamps: list[int]) -> list[str]:
+        """
+        Convert ms timestamps to 'YYYY-MM-DD' strings in one vectorised
+        pass. Dates are UTC, matching ee.Date formatting server-side.
+        """
+        if not len(timestamps):
+            return []
+        days = np.asarray(timestamps, dtype='int64').astype('datetime64[ms]')
+        return np.datetime_as_string(days, unit='D').tolist()
+
     @staticmethod
     def timestamps_to_date_list(timestamps: list[int]) -> list[tuple[int, str, datetime]]:
         """
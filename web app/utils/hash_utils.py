@@ -3,33 +3,61 @@ Responsible for: generating deterministic hashes from analysis config dicts.
 """
 
 import hashlib
+import json
 
 
 class HashUtils:
     """
-    Produces a SHA-256 hex string from the fields that uniquely identify
-    an analysis run. Used as a cache key in the database.
+    Produces a BLAKE2b hex string from the fields that uniquely identify
+    an analysis run. Used as a cache key in the database, so collision
+    resistance matters but cryptographic strength does not.
     """
 
+    # Config fields that define an analysis, in canonical order
+    KEY_FIELDS = (
+        'site_name', 'center_lat', 'center_lon', 'buffer_km',
+        'start_date', 'end_date', 'cloud_cover',
+    )
+
+    # Coordinates are rounded to 4 dp (≈ 11 m of latitude) before hashing.
+    # Dates and buffer stay exact: they pick the image set and the AOI.
+    COORD_DECIMALS = 4
+
+    # 32-byte digest keeps the 64-char hex width of params_hash VARCHAR(64)
+    DIGEST_SIZE = 32
+
     @staticmethod
     def hash_config(config: dict) -> str:
         """
         Build a deterministic hash from the fields that define an analysis:
         site_name, coordinates, buffer, date range and cloud cover.
 
+        Coordinates are rounded first (see COORD_DECIMALS), so nudging the
+        map pin by a few metres reuses the cached result. Dates and buffer
+        are kept exact, because they decide which images are reduced.
+
+        The fields are serialised as canonical JSON (sorted keys, fixed
+        separators), so separators inside a site name cannot make two
+        different configs collide.
+
         Args:
             config: Analysis configuration dict.
 
         Returns:
-            64-character hex SHA-256 string.
+            64-character hex BLAKE2b string.
         """
-        key = (
-            f"{config['site_name']}_"
-            f"{config['center_lat']}_"
-            f"{config['center_lon']}_"
-            f"{config['buffer_km']}_"
-            f"{config['start_date']}_"
-            f"{config['end_date']}_"
-            f"{config['cloud_cover']}"
+        key = json.dumps(
+            HashUtils._quantise({field: config[field] for field in HashUtils.KEY_FIELDS}),
+            sort_keys=True, separators=(',', ':'), default=str,
         )
-        return hashlib.sha256(key.encode()).hexdigest()
\ No newline at end of file
+        return hashlib.blake2b(
+            key.encode(), digest_size=HashUtils.DIGEST_SIZE, usedforsecurity=False,
+        ).hexdigest()
+
+    @staticmethod
+    def _quantise(fields: dict) -> dict:
+        return {
+            **fields,
+            'center_lat': round(fields['center_lat'], HashUtils.COORD_DECIMALS),
+            'center_lon': round(fields['center_lon'], HashUtils.COORD_DECIMALS),
+        }
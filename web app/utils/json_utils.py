@@ -0,0 +1,37 @@
+"""
+Responsible for: JSON encoding/decoding of persisted payloads.
+"""
+
+import json
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+    # Match the stdlib's leniency: numpy scalars and non-str dict keys
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    _HAS_ORJSON = False
+
+
+class JsonUtils:
+    """
+    JSON round-trips for the blobs stored in MySQL. orjson is an optional
+    speed-up, not a requirement: when it is installed (`pip install orjson`,
+    several times faster on stats-sized dicts) it is used, otherwise the
+    standard library is; both produce plain str/dict values.
+    """
+
+    @staticmethod
+    def dumps(obj, pretty: bool = False) -> str:
+        """Serialise *obj* to a JSON string; *pretty* indents by 2 spaces."""
+        if _HAS_ORJSON:
+            opts = _ORJSON_OPTS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTS
+            return orjson.dumps(obj, option=opts).decode()
+        return json.dumps(obj, indent=2 if pretty else None)
+
+    @staticmethod
+    def loads(data: str | bytes):
+        """Parse a JSON string or bytes blob."""
+        if _HAS_ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
@@ -0,0 +1,26 @@
+"""
+Responsible for: normalising index colour palettes for CSS gradients.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _gradient_css(palette: tuple[str, ...]) -> str:
+    return ', '.join(p if p.startswith('#') else '#' + p for p in palette)
+
+
+class PaletteUtils:
+    """
+    Turns index palettes (hex strings with or without '#') into the colour
+    list of a CSS linear-gradient. Results are memoised per palette, so
+    reruns reuse the joined string instead of rebuilding it.
+
+    Usage:
+        grad = PaletteUtils.gradient_css(INDICES_CONFIG['NDVI']['palette'])
+    """
+
+    @staticmethod
+    def gradient_css(palette: list[str] | tuple[str, ...]) -> str:
+        """Return comma-separated '#rrggbb' colours for a linear-gradient."""
+        return _gradient_css(tuple(palette))
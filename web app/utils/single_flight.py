@@ -0,0 +1,40 @@
+"""
+Responsible for: coalescing concurrent identical background jobs.
+"""
+
+import threading
+from concurrent.futures import Future, Executor
+
+
+class SingleFlight:
+    """
+    Hands every caller asking for the same key the one in-flight Future,
+    so N sessions missing the cache for the same analysis start one GEE
+    job instead of N. The key is forgotten as soon as the job finishes;
+    by then the result is on its way into the database cache.
+
+    Usage:
+        flights = SingleFlight(executor)
+        future  = flights.submit(params_hash, stats_calc.run_multiple, image, aoi, indices)
+    """
+
+    def __init__(self, executor: Executor):
+        self._executor = executor
+        self._inflight: dict[str, Future] = {}
+        # Re-entrant: a job that is already done runs its callback inline
+        self._lock = threading.RLock()
+
+    def submit(self, key: str, fn, *args, **kwargs) -> Future:
+        """Return the Future running *fn* for *key*, starting it if needed."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(fn, *args, **kwargs)
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._forget(key, done))
+            return future
+
+    def _forget(self, key: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -0,0 +1,72 @@
+"""
+Responsible for: Streamlit version shims shared by the frontend.
+"""
+
+import functools
+import threading
+import time
+
+import ee
+import streamlit as st
+
+# Partial reruns: st.fragment (1.37+), st.experimental_fragment (1.33–1.36).
+# On older releases the decorated function just runs with the full script.
+_native_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+fragment = _native_fragment or (lambda func: func)
+
+
+# Background-job status notices poll from a fragment that reruns on its own
+# timer, so the rest of the page is not rebuilt every tick. Without fragment
+# support the body runs once per script run and flags a poll instead;
+# rerun_if_poll_due() at the very end of the script honours it.
+_POLL_DUE_KEY = '_poll_due_seconds'
+
+
+def polling_fragment(run_every: float):
+    if _native_fragment is not None:
+        return _native_fragment(run_every=run_every)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            st.session_state[_POLL_DUE_KEY] = run_every
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def rerun_if_poll_due() -> None:
+    """Legacy fallback (no fragments): one blocking sleep + full rerun."""
+    delay = st.session_state.pop(_POLL_DUE_KEY, None)
+    if delay is not None:
+        time.sleep(delay)
+        st.rerun()
+
+
+# st.cache_data keys for EE arguments: the serialised computation graph is a
+# stable, content-based identity for lazily-built ee objects.
+EE_HASH_FUNCS = {
+    ee.Image:             lambda obj: obj.serialize(),
+    ee.ImageCollection:   lambda obj: obj.serialize(),
+    ee.Geometry:          lambda obj: obj.serialize(),
+    ee.FeatureCollection: lambda obj: obj.serialize(),
+}
+
+
+# Write counter passed into cached history reads: bumping it after a save
+# forces a fresh query instead of waiting out the TTL. st.cache_data is shared
+# by every session, so the counter must be process-wide as well.
+
+@st.cache_resource
+def _history_counter() -> dict:
+    return {'version': 0, 'lock': threading.Lock()}
+
+
+def history_version() -> int:
+    return _history_counter()['version']
+
+
+def bump_history_version() -> None:
+    counter = _history_counter()
+    with counter['lock']:
+        counter['version'] += 1
@@ -1,8 +1,19 @@
 """
 Responsible for: building Plotly figure objects.
 All methods receive plain Python data and return go.Figure instances.
+
+Traces and layouts are plain dicts handed to a single go.Figure call, so
+each property is validated once, on the way into the figure, instead of
+once per go.Scatter / go.Bar object and again on add_trace/update_layout.
 """
 
+import functools
+import threading
+import warnings
+from collections import OrderedDict
+from itertools import cycle, islice
+
+import numpy as np
 import plotly.graph_objects as go
 
 _PALETTE = ['#764ba2', '#f0c040', '#9b6fc5', '#4a2d6b', '#d4a017', '#c084f5', '#1a1a2e', '#6b6b8a']
@@ -16,10 +27,91 @@ _LAYOUT_BASE = dict(
     yaxis=dict(gridcolor='#e8e0f0', linecolor='#c5c5d8'),
 )
 
+# Static layout per chart type, built once; each call only adds its titles
+_TIME_SERIES_LAYOUT = dict(_LAYOUT_BASE, xaxis_title='Date', hovermode='x unified')
+_COMPARISON_LAYOUT  = dict(
+    _LAYOUT_BASE, barmode='group',
+    legend=dict(bgcolor='#f3edf9', bordercolor='#c5c5d8', borderwidth=1),
+)
+_MULTI_INDEX_LAYOUT = dict(_LAYOUT_BASE, xaxis_title='Spectral Index', yaxis_title='Value')
+_HEATMAP_LAYOUT     = dict(template='plotly_white', height=500)
+
+
+# ── Figure memo ──────────────────────────────────────────────────────────────
+# Charts are pure functions of their arguments, and tabs rebuild the same
+# ones on every rerun (polling, widget changes elsewhere on the page).
+
+_FIGURE_CACHE_SIZE = 32   # per chart method
+
+
+def _freeze(obj):
+    """Hashable content fingerprint of chart input (dicts keep their order)."""
+    if isinstance(obj, dict):
+        return tuple((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, np.ndarray):
+        return obj.shape, obj.dtype.str, obj.tobytes()
+    if hasattr(obj, 'index') and hasattr(obj, 'to_numpy'):   # pandas Series
+        return tuple(obj.index), _freeze(obj.to_numpy())
+    return obj
+
+
+def _memoised_figure(method):
+    """
+    LRU-memoise a ChartBuilder method on the content of its arguments.
+    The cached figure is shared, so callers must treat it as read-only.
+    """
+    cache = OrderedDict()
+    lock  = threading.Lock()
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (_freeze(args), _freeze(dict(sorted(kwargs.items()))))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        fig = method(self, *args, **kwargs)
+        with lock:
+            cache[key] = fig
+            if len(cache) > _FIGURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return fig
+
+    return wrapper
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of *n_out* points that keep the
+    visible shape of (x, y). First and last points are always kept; each
+    middle bucket keeps the point spanning the largest triangle with the
+    previously kept point and the next bucket's centroid.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)   # n_out - 2 buckets
+    keep  = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi   = edges[i], edges[i + 1]
+        nxt_hi   = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x    = x[hi:nxt_hi].mean()
+        avg_y    = y[hi:nxt_hi].mean()
+        area     = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a        = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
 
 class ChartBuilder:
     """
-    Factory for all Plotly charts used in the application.
+    Factory for all Plotly charts used in the application. Identical calls
+    return the same memoised figure; do not mutate what is returned.
 
     Usage:
         charts = ChartBuilder()
@@ -27,40 +119,55 @@ class ChartBuilder:
         st.plotly_chart(fig)
     """
 
+    WEBGL_MIN_POINTS = 1000            # time_series switches to Scattergl above this
+    UNIFIED_HOVER_MAX_POINTS = 50_000  # ...and drops unified hover above this
+
+    @_memoised_figure
     def time_series(
         self,
         data: dict[str, dict[str, float]],
         title: str,
         y_label: str = 'Value',
+        max_points_per_trace: int = 2000,
     ) -> go.Figure:
         """
         Line chart with markers for one or more index time series.
+        Series longer than *max_points_per_trace* are LTTB-downsampled
+        before they are sent to the browser.
 
         Args:
-            data:    {series_name: {date_str: value}}
+            data:    {series_name: {date_str: value} or date-indexed Series}
             title:   Chart title.
             y_label: Y-axis label.
+            max_points_per_trace: Point budget per series.
         """
-        fig = go.Figure()
-        for i, (name, values) in enumerate(data.items()):
-            color = _PALETTE[i % len(_PALETTE)]
-            fig.add_trace(go.Scatter(
-                x=list(values.keys()),
-                y=list(values.values()),
+        series = [
+            (name, *self._series_arrays(values, max_points_per_trace))
+            for name, values in data.items()
+        ]
+        # WebGL past a few thousand points; SVG scatter slows down badly there
+        total = sum(len(y) for _, _, y in series)
+        trace_type = 'scattergl' if total > self.WEBGL_MIN_POINTS else 'scatter'
+        traces = [
+            dict(
+                type=trace_type,
+                x=x,
+                y=y,
                 mode='lines+markers',
                 name=name,
                 line=dict(width=3, color=color),
                 marker=dict(size=8, color=color),
-            ))
-        fig.update_layout(
-            title=title,
-            xaxis_title='Date',
-            yaxis_title=y_label,
-            hovermode='x unified',
-            **_LAYOUT_BASE,
-        )
-        return fig
+            )
+            for (name, x, y), color in zip(series, cycle(_PALETTE))
+        ]
+        # Unified hover searches every trace on each mouse move; off when huge
+        hovermode = 'x unified' if total < self.UNIFIED_HOVER_MAX_POINTS else False
+        return go.Figure(data=traces, layout=dict(
+            _TIME_SERIES_LAYOUT, title=title, yaxis_title=y_label,
+            hovermode=hovermode, uirevision=title,
+        ))
 
+    @_memoised_figure
     def before_after_bars(
         self,
         before_values: list[float],
@@ -76,31 +183,28 @@ class ChartBuilder:
             index_name:    Used in title and y-axis label.
         """
         categories = ['Median', 'Std Dev', 'Min', 'Max']
-        fig = go.Figure(data=[
-            go.Bar(
+        return go.Figure(data=[
+            dict(
+                type='bar',
                 name='Before',
                 x=categories,
                 y=before_values,
-                marker_color='#9b6fc5',
-                marker_line=dict(color='#764ba2', width=1),
+                marker=dict(color='#9b6fc5', line=dict(color='#764ba2', width=1)),
             ),
-            go.Bar(
+            dict(
+                type='bar',
                 name='After',
                 x=categories,
                 y=after_values,
-                marker_color='#f0c040',
-                marker_line=dict(color='#d4a017', width=1),
+                marker=dict(color='#f0c040', line=dict(color='#d4a017', width=1)),
             ),
-        ])
-        fig.update_layout(
+        ], layout=dict(
+            _COMPARISON_LAYOUT,
             title=f'{index_name} Comparison: Before vs After',
-            barmode='group',
             yaxis_title=f'{index_name} Value',
-            legend=dict(bgcolor='#f3edf9', bordercolor='#c5c5d8', borderwidth=1),
-            **_LAYOUT_BASE,
-        )
-        return fig
+        ))
 
+    @_memoised_figure
     def multi_index_bars(
         self,
         data: dict[str, float],
@@ -113,38 +217,99 @@ class ChartBuilder:
             data:  {index_name: median_value}
             title: Chart title.
         """
-        n = len(data)
-        fig = go.Figure(data=[
-            go.Bar(
+        return go.Figure(data=[
+            dict(
+                type='bar',
                 x=list(data.keys()),
                 y=list(data.values()),
                 marker=dict(
-                    color=[_PALETTE[i % len(_PALETTE)] for i in range(n)],
+                    color=list(islice(cycle(_PALETTE), len(data))),
                     line=dict(color='#4a2d6b', width=1),
                 ),
             )
-        ])
-        fig.update_layout(
-            title=title,
-            xaxis_title='Spectral Index',
-            yaxis_title='Value',
-            **_LAYOUT_BASE,
-        )
-        return fig
+        ], layout=dict(_MULTI_INDEX_LAYOUT, title=title))
 
+    # Above this many cells the heatmap is block-averaged server-side to
+    # roughly the canvas resolution instead of shipping every cell.
+    HEATMAP_MAX_CELLS = 200_000
+    HEATMAP_CANVAS_PX = 500
+    # Above this many drawn cells per-cell hover tooltips are skipped
+    HEATMAP_HOVER_MAX_CELLS = 40_000
+
+    @_memoised_figure
     def heatmap(
         self,
-        matrix: list[list[float]],
+        matrix: np.ndarray,
         x_labels: list[str],
         y_labels: list[str],
         title: str = 'Correlation Heatmap',
+        enable_hover: bool | None = None,
     ) -> go.Figure:
-        fig = go.Figure(data=go.Heatmap(
-            z=matrix,
-            x=x_labels,
-            y=y_labels,
-            colorscale='RdBu',
-            zmid=0,
-        ))
-        fig.update_layout(title=title, template='plotly_white', height=500)
-        return fig
\ No newline at end of file
+        """
+        Diverging heatmap of *matrix*. Hover is on for small grids only,
+        unless *enable_hover* forces it either way.
+        """
+        if not isinstance(matrix, np.ndarray):
+            # Nested lists are walked cell by cell, here and in the memo key
+            warnings.warn(
+                'ChartBuilder.heatmap: pass a numpy ndarray, not '
+                f'{type(matrix).__name__}, to avoid a per-cell conversion',
+                stacklevel=3,
+            )
+        # float32 is visually identical at heatmap resolution and halves the payload
+        z = np.ascontiguousarray(matrix, dtype=np.float32)
+        if z.size > self.HEATMAP_MAX_CELLS:
+            z, x_labels, y_labels = self._downsample_grid(z, x_labels, y_labels)
+        if enable_hover is None:
+            enable_hover = z.size <= self.HEATMAP_HOVER_MAX_CELLS
+        return go.Figure(
+            data=[dict(
+                type='heatmap', z=z, x=x_labels, y=y_labels,
+                colorscale='RdBu', zmid=0, hoverinfo=None if enable_hover else 'skip',
+            )],
+            layout=dict(_HEATMAP_LAYOUT, title=title, uirevision=title),
+        )
+
+    @staticmethod
+    def _series_arrays(values: dict[str, float], n_out: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        One pass over a {date_str: value} series (or a date-indexed pandas
+        Series) into (dates, float64 values) arrays, LTTB-thinned to *n_out*
+        points when longer (date strings are ISO).
+        Values stay float64: float32 would surface as rounding noise in
+        hover and exports (0.45 → 0.44999998807907104).
+        """
+        if len(values) == 0:
+            return np.array([], dtype=str), np.array([], dtype=np.float64)
+        if hasattr(values, 'to_numpy'):
+            # pandas Series indexed by date: take its buffers, no item walk
+            x = np.asarray(values.index)
+            y = values.to_numpy(dtype=np.float64)
+        else:
+            dates, vals = zip(*values.items())
+            x = np.asarray(dates)
+            y = np.fromiter(vals, dtype=np.float64, count=len(vals))
+        if len(y) > n_out:
+            keep = _lttb_indices(x.astype('datetime64[D]').astype(np.float64), y, n_out)
+            x, y = x[keep], y[keep]
+        return x, y
+
+    @classmethod
+    def _downsample_grid(
+        cls, z: np.ndarray, x_labels: list[str], y_labels: list[str]
+    ) -> tuple[np.ndarray, list[str], list[str]]:
+        """
+        Block-mean *z* so neither axis exceeds HEATMAP_CANVAS_PX cells; each
+        block keeps the label of its first row/column. NaN cells are ignored.
+        """
+        fy = -(-z.shape[0] // cls.HEATMAP_CANVAS_PX)   # ceil division
+        fx = -(-z.shape[1] // cls.HEATMAP_CANVAS_PX)
+        ny, nx = -(-z.shape[0] // fy), -(-z.shape[1] // fx)
+
+        # Pad with NaN to whole blocks, then average each (fy, fx) tile
+        padded = np.full((ny * fy, nx * fx), np.nan, dtype=z.dtype)
+        padded[:z.shape[0], :z.shape[1]] = z
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)   # all-NaN blocks stay NaN
+            blocks = np.nanmean(padded.reshape(ny, fy, nx, fx), axis=(1, 3))
+        return blocks, list(x_labels)[::fx], list(y_labels)[::fy]